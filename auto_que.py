@@ -4,27 +4,45 @@
 from __future__ import annotations
 
 import argparse
-import contextlib
-import io
+import concurrent.futures
+import functools
+import http.client
 import json
 import os
+import socket
 import subprocess
 import sys
+import threading
 import time
-import urllib.error
-import urllib.request
-from dataclasses import asdict, dataclass
+from collections import Counter
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
 
-from playwright.sync_api import sync_playwright
-
 import nexus_browser_first as baseline
 from user_config import AppConfig, load_config, save_config
-from v3_install import install_downloaded_archives
 
 APP_NAME = "NexusCollectionBatch"
+DOWNLOAD_REASON_KINDS = frozenset({"download_saved", "direct_download", "direct_download_insecure_ssl"})
+ATTENTION_STATUSES = frozenset({"fail", "partial", "fallback_needed"})
+SUMMARY_TEMPLATE = (
+    "run_id: {run_id}\n"
+    "collection_url: {collection_url}\n"
+    "queue_count: {queue_count}\n"
+    "ok: {ok}\n"
+    "partial: {partial}\n"
+    "fallback_needed: {fallback_needed}\n"
+    "fail: {fail}\n"
+    "dry_run: {dry_run}\n"
+    "install_ok: {install_ok}\n"
+    "install_fail: {install_fail}\n"
+    "json_log: {json_log}\n"
+)
+NEXUS_HOSTS = ("www.nexusmods.com", "files.nexusmods.com", "cf-files.nexusmods.com")
+
+# Keep-alive connections to the CDP HTTP endpoint, keyed by (scheme, host, port).
+_CDP_CONNECTIONS: dict[tuple[str, str, int], http.client.HTTPConnection] = {}
 
 
 @dataclass
@@ -41,6 +59,34 @@ class StageSettings:
     delay_sec: float
     download_timeout_sec: int
     skip_install: bool
+    download_workers: int
+
+
+class RunResults:
+    """Per-mod result rows plus the counts the logs and final summary need, tallied as items arrive."""
+
+    def __init__(self) -> None:
+        self.rows: list[dict[str, Any]] = []
+        self.status_counts: Counter[str] = Counter()
+        self.downloaded = 0
+        self.attention = 0
+
+    def append(self, item: baseline.ItemResult) -> None:
+        self.rows.append(baseline.item_to_dict(item))
+        self.status_counts[item.status] += 1
+        if item.saved_path:
+            self.downloaded += 1
+        if item.status in ATTENTION_STATUSES:
+            self.attention += 1
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, RunResults):
+        return value.rows
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
 
 
 def now_stamp() -> str:
@@ -75,6 +121,7 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--click-timeout-sec", type=float, default=12.0)
     parser.add_argument("--delay-sec", type=float, default=1.5)
     parser.add_argument("--download-timeout-sec", type=int, default=45)
+    parser.add_argument("--download-workers", type=int, default=4, help="Parallel direct HTTP downloads")
     return parser.parse_args()
 
 
@@ -112,11 +159,12 @@ def resolve_settings(args: argparse.Namespace, config: AppConfig) -> StageSettin
             raise KeyboardInterrupt("User cancelled before run.")
 
     assert collection_url is not None
-    if not baseline.COLLECTION_URL_RE.match(collection_url.strip()):
+    cleaned_url = baseline.parse_and_clean_collection_url(collection_url.strip())
+    if cleaned_url is None:
         raise ValueError("Collection URL format is invalid.")
 
     settings = StageSettings(
-        collection_url=baseline.clean_collection_url(collection_url),
+        collection_url=cleaned_url,
         downloads_dir=Path(downloads_dir),
         install_dir=Path(install_dir),
         cdp_url=args.cdp_url,
@@ -128,31 +176,76 @@ def resolve_settings(args: argparse.Namespace, config: AppConfig) -> StageSettin
         delay_sec=max(0.0, float(args.delay_sec)),
         download_timeout_sec=max(5, int(args.download_timeout_sec)),
         skip_install=bool(args.skip_install),
+        download_workers=max(1, int(args.download_workers)),
     )
     return settings
 
 
+def warm_dns(hosts: tuple[str, ...] = NEXUS_HOSTS) -> None:
+    # The OS resolver caches answers, so later connects skip the lookup.
+    for host in hosts:
+        try:
+            socket.getaddrinfo(host, 443)
+        except OSError:
+            pass
+
+
 def stage_header(index: int, total: int, text: str) -> None:
     print(f"\nStage {index}/{total}: {text}")
 
 
+@functools.lru_cache(maxsize=8)
+def _cdp_target(cdp_url: str) -> tuple[tuple[str, str, int], str]:
+    parsed = baseline.urlparse(cdp_url)
+    scheme = parsed.scheme or "http"
+    port = parsed.port or (443 if scheme == "https" else 80)
+    probe_path = parsed.path.rstrip("/") + "/json/version"
+    return (scheme, parsed.hostname or "127.0.0.1", port), probe_path
+
+
+def _cdp_connection(key: tuple[str, str, int], timeout_sec: float) -> http.client.HTTPConnection:
+    conn = _CDP_CONNECTIONS.get(key)
+    if conn is None:
+        scheme, host, port = key
+        conn_cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        conn = conn_cls(host, port, timeout=timeout_sec)
+        _CDP_CONNECTIONS[key] = conn
+    conn.timeout = timeout_sec
+    if conn.sock is not None:
+        conn.sock.settimeout(timeout_sec)
+    return conn
+
+
 def ensure_cdp_reachable(cdp_url: str, timeout_sec: float = 4.0) -> tuple[bool, str]:
     probe = cdp_url.rstrip("/") + "/json/version"
+    key, probe_path = _cdp_target(cdp_url)
+    conn = _cdp_connection(key, timeout_sec)
     try:
-        with urllib.request.urlopen(probe, timeout=timeout_sec) as response:
-            if response.status == 200:
-                return True, probe
-            return False, f"CDP endpoint returned HTTP {response.status}: {probe}"
-    except urllib.error.URLError:
+        try:
+            conn.request("GET", probe_path)
+            response = conn.getresponse()
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            # The browser dropped the idle keep-alive socket; retry once on a fresh one.
+            conn.close()
+            conn.request("GET", probe_path)
+            response = conn.getresponse()
+        response.read()
+        if response.status == 200:
+            return True, probe
+        return False, f"CDP endpoint returned HTTP {response.status}: {probe}"
+    except OSError:
+        conn.close()
         return (
             False,
             "CDP endpoint is not reachable.",
         )
     except Exception as exc:
+        conn.close()
         return False, f"CDP endpoint check failed: {exc}"
 
 
-def candidate_browser_paths() -> list[Path]:
+@functools.lru_cache(maxsize=1)
+def candidate_browser_paths() -> tuple[Path, ...]:
     local_app_data = os.environ.get("LOCALAPPDATA", "")
     paths = [
         Path(r"C:\Program Files\BraveSoftware\Brave-Browser\Application\brave.exe"),
@@ -168,36 +261,44 @@ def candidate_browser_paths() -> list[Path]:
                 base / "Google" / "Chrome" / "Application" / "chrome.exe",
             ]
         )
-    seen: set[str] = set()
-    out: list[Path] = []
-    for path in paths:
-        key = str(path).lower()
-        if key in seen:
-            continue
-        seen.add(key)
-        out.append(path)
-    return out
+    # Case-insensitive dedupe (Windows paths) while keeping the preference order.
+    return tuple({str(path).lower(): path for path in paths}.values())
+
+
+@functools.lru_cache(maxsize=1)
+def _devnull_fd() -> int:
+    return os.open(os.devnull, os.O_WRONLY)
+
+
+def cdp_port_accepting(host: str, port: int, timeout_sec: float) -> bool:
+    try:
+        with socket.create_connection((host, port), timeout=timeout_sec):
+            return True
+    except OSError:
+        return False
 
 
 def try_launch_browser_for_cdp(cdp_url: str) -> tuple[bool, str]:
     parsed = baseline.urlparse(cdp_url)
+    host = parsed.hostname or "127.0.0.1"
     port = parsed.port or 9222
-    for browser_path in candidate_browser_paths():
-        if not browser_path.exists():
-            continue
+    for browser_path in (path for path in candidate_browser_paths() if path.exists()):
         cmd = [str(browser_path), f"--remote-debugging-port={port}", "--profile-directory=Default", "--new-window"]
         try:
-            subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            # Python fds are non-inheritable by default, so POSIX can skip the close_fds walk.
+            subprocess.Popen(cmd, stdout=_devnull_fd(), stderr=_devnull_fd(), close_fds=os.name == "nt")
         except Exception:
             continue
 
-        deadline_ms = 20000
-        start = datetime.now()
-        while int((datetime.now() - start).total_seconds() * 1000) < deadline_ms:
-            ok, detail = ensure_cdp_reachable(cdp_url, timeout_sec=1.5)
-            if ok:
-                return True, f"Launched browser for CDP: {browser_path}"
-            time.sleep(0.75)
+        deadline = time.monotonic() + 20.0
+        delay = 0.05
+        while time.monotonic() < deadline:
+            if cdp_port_accepting(host, port, timeout_sec=0.25):
+                ok, detail = ensure_cdp_reachable(cdp_url, timeout_sec=1.5)
+                if ok:
+                    return True, f"Launched browser for CDP: {browser_path}"
+            time.sleep(delay)
+            delay = min(delay * 1.5, 0.5)
         continue
     return False, "Could not find Brave/Chrome executable to auto-launch."
 
@@ -212,9 +313,9 @@ def cdp_help_text(cdp_url: str) -> str:
 
 
 def find_download_path(reason: str) -> Optional[Path]:
-    for prefix in ("download_saved:", "direct_download:", "direct_download_insecure_ssl:"):
-        if reason.startswith(prefix):
-            return Path(reason[len(prefix) :].strip())
+    kind, sep, path = reason.partition(":")
+    if sep and kind in DOWNLOAD_REASON_KINDS:
+        return Path(path.strip())
     return None
 
 
@@ -238,6 +339,10 @@ def parse_mod_id(url: str) -> str:
 
 
 def run_download_stage(settings: StageSettings, run_data: dict[str, Any]) -> list[Path]:
+    # Deferred: importing Playwright is slow and not needed for --help or input errors.
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+    from playwright.sync_api import sync_playwright
+
     downloaded_files: list[Path] = []
     with sync_playwright() as p:
         browser = p.chromium.connect_over_cdp(settings.cdp_url)
@@ -246,15 +351,21 @@ def run_download_stage(settings: StageSettings, run_data: dict[str, Any]) -> lis
 
         try:
             cookies = context.cookies(["https://www.nexusmods.com"])
-            cookie_header = "; ".join(f"{c['name']}={c['value']}" for c in cookies)
+            cookie_header = baseline.cookie_header_from(cookies)
         except Exception:
             cookie_header = ""
+        session = baseline.HttpSession()
 
         print("- Loading collection page...")
-        extraction = baseline.collect_links_via_network(page, settings.collection_url)
+        extraction, game_id = baseline.collect_collection_links(
+            page,
+            settings.collection_url,
+            cookie_header,
+            settings.log_dir / baseline.GRAPHQL_CACHE_FILE,
+            session,
+        )
         links = extraction.links
-        run_data["extraction"]["network_graphql"] = extraction.details
-        game_id = baseline.extract_game_id(page.content())
+        run_data["extraction"][extraction.strategy] = extraction.details
         run_data["game_id"] = game_id
 
         if not links:
@@ -279,31 +390,80 @@ def run_download_stage(settings: StageSettings, run_data: dict[str, Any]) -> lis
             return downloaded_files
 
         print("\nStage 3/4: Downloading mods")
-        for idx, mod_url in enumerate(links, start=1):
-            mod_id_text = parse_mod_id(mod_url)
-            print(f"[{idx}/{len(links)}] mod {mod_id_text} ...", end="")
-            with contextlib.redirect_stdout(io.StringIO()):
-                item = baseline.process_mod(
-                    page=page,
-                    mod_url=mod_url,
-                    click_timeout_sec=settings.click_timeout_sec,
-                    dry_run=settings.dry_run,
-                    verify_downloads=settings.verify_downloads,
-                    downloads_dir=settings.downloads_dir,
-                    download_timeout_sec=settings.download_timeout_sec,
-                    cookie_header=cookie_header,
-                    game_id=game_id,
+        # Direct HTTP downloads fan out on a bounded pool; the click flow stays on this thread
+        # because Playwright's sync API is not thread-safe.
+        pool = concurrent.futures.ThreadPoolExecutor(max_workers=settings.download_workers)
+        direct_paths: set[Path] = set()
+        cancel = threading.Event()
+        watcher = baseline.DownloadWatcher(settings.downloads_dir)
+        if settings.verify_downloads and not settings.dry_run:
+            watcher.start()
+        try:
+            direct_futures: list[Optional[concurrent.futures.Future[Optional[baseline.ItemResult]]]] = [
+                pool.submit(
+                    baseline.try_direct_download,
+                    mod_url,
+                    settings.downloads_dir,
+                    cookie_header,
+                    game_id,
+                    session,
+                    verbose=False,
+                    claimed=direct_paths,
+                    cancel=cancel,
                 )
-            item.index = idx
-            item_data = asdict(item)
-            run_data["results"].append(item_data)
-            print(f" {item.status.upper()} - {format_reason_for_console(item.reason)}")
-            saved = find_download_path(item.reason)
-            if saved is not None:
-                downloaded_files.append(saved)
-            if idx < len(links):
-                page.wait_for_timeout(int(settings.delay_sec * 1000))
-        page.wait_for_timeout(400)
+                if settings.verify_downloads and not settings.dry_run
+                else None
+                for mod_url in links
+            ]
+            results_append = run_data["results"].append
+            links_len = len(links)
+            delay_ms = int(settings.delay_sec * 1000)
+            for idx, mod_url in enumerate(links, start=1):
+                mod_id_text = parse_mod_id(mod_url)
+                print(f"[{idx}/{links_len}] mod {mod_id_text} ...", end="")
+                direct_future = direct_futures[idx - 1]
+                item = direct_future.result() if direct_future is not None else None
+                used_browser = item is None
+                if item is None:
+                    item = baseline.process_mod(
+                        page=page,
+                        mod_url=mod_url,
+                        click_timeout_sec=settings.click_timeout_sec,
+                        dry_run=settings.dry_run,
+                        verify_downloads=settings.verify_downloads,
+                        downloads_dir=settings.downloads_dir,
+                        download_timeout_sec=settings.download_timeout_sec,
+                        cookie_header=cookie_header,
+                        game_id=game_id,
+                        session=session,
+                        verbose=False,
+                        skip_direct=direct_future is not None,
+                        watcher=watcher,
+                        claimed_paths=direct_paths,
+                    )
+                item.index = idx
+                results_append(item)
+                print(f" {item.status.upper()} - {format_reason_for_console(item.reason)}")
+                if item.saved_path:
+                    downloaded_files.append(Path(item.saved_path))
+                if used_browser and idx < links_len:
+                    page.wait_for_timeout(delay_ms)
+        except BaseException:
+            # Ctrl+C or a fatal error: downloads already streaming stop at their next chunk.
+            cancel.set()
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+        else:
+            pool.shutdown(wait=True)
+        finally:
+            watcher.stop()
+        session.close()
+        if not settings.verify_downloads and not settings.dry_run:
+            # The last click's download is still owned by the browser; let its requests settle.
+            try:
+                page.wait_for_load_state("networkidle", timeout=1500)
+            except PlaywrightTimeoutError:
+                pass
     return downloaded_files
 
 
@@ -312,36 +472,35 @@ def write_run_logs(log_dir: Path, run_id: str, run_data: dict[str, Any]) -> tupl
     json_log = log_dir / f"nexus-collection-batch-{run_id}.json"
     txt_log = log_dir / f"nexus-collection-batch-{run_id}.txt"
 
-    ok_count = sum(1 for r in run_data["results"] if r["status"] == "ok")
-    partial_count = sum(1 for r in run_data["results"] if r["status"] == "partial")
-    fail_count = sum(1 for r in run_data["results"] if r["status"] == "fail")
-    fallback_count = sum(1 for r in run_data["results"] if r["status"] == "fallback_needed")
-    dry_count = sum(1 for r in run_data["results"] if r["status"] == "dry_run")
+    status_counts = run_data["results"].status_counts
     installed = run_data.get("install_summary", {}).get("installed", 0)
     install_failed = run_data.get("install_summary", {}).get("failed", 0)
 
-    summary = [
-        f"run_id: {run_id}",
-        f"collection_url: {run_data['collection_url']}",
-        f"queue_count: {run_data['queue_count']}",
-        f"ok: {ok_count}",
-        f"partial: {partial_count}",
-        f"fallback_needed: {fallback_count}",
-        f"fail: {fail_count}",
-        f"dry_run: {dry_count}",
-        f"install_ok: {installed}",
-        f"install_fail: {install_failed}",
-        f"json_log: {json_log}",
-    ]
-
-    json_log.write_text(json.dumps(run_data, indent=2), encoding="utf-8")
-    txt_log.write_text("\n".join(summary) + "\n", encoding="utf-8")
+    with json_log.open("w", encoding="utf-8") as fh:
+        json.dump(run_data, fh, indent=2, default=_json_default)
+    txt_log.write_text(
+        SUMMARY_TEMPLATE.format(
+            run_id=run_id,
+            collection_url=run_data["collection_url"],
+            queue_count=run_data["queue_count"],
+            ok=status_counts["ok"],
+            partial=status_counts["partial"],
+            fallback_needed=status_counts["fallback_needed"],
+            fail=status_counts["fail"],
+            dry_run=status_counts["dry_run"],
+            install_ok=installed,
+            install_fail=install_failed,
+            json_log=json_log,
+        ),
+        encoding="utf-8",
+    )
     return json_log, txt_log
 
 
 def print_final_summary(run_data: dict[str, Any], json_log: Path, txt_log: Path) -> None:
-    downloaded = sum(1 for r in run_data["results"] if find_download_path(r["reason"]) is not None)
-    failed = sum(1 for r in run_data["results"] if r["status"] in {"fail", "partial", "fallback_needed"})
+    results = run_data["results"]
+    downloaded = results.downloaded
+    failed = results.attention
     install_summary = run_data.get("install_summary", {})
     print("\nFinal summary")
     print(f"- Queue: {run_data['queue_count']}")
@@ -375,6 +534,8 @@ def main() -> int:
         print(f"[!] Input error: {exc}")
         return 2
 
+    threading.Thread(target=warm_dns, daemon=True).start()
+
     config.collection_url = settings.collection_url
     config.downloads_dir = settings.downloads_dir
     config.install_dir = settings.install_dir
@@ -393,7 +554,7 @@ def main() -> int:
         "verify_downloads": settings.verify_downloads,
         "queue_count": 0,
         "queue_first_5": [],
-        "results": [],
+        "results": RunResults(),
         "extraction": {},
         "install_summary": {},
     }
@@ -419,11 +580,14 @@ def main() -> int:
         if settings.skip_install or settings.dry_run:
             print("- Install stage skipped.")
         else:
+            from v3_install import install_downloaded_archives
+
             install_summary = install_downloaded_archives(
                 downloaded_paths=downloaded_paths,
                 install_dir=settings.install_dir,
                 log_dir=settings.log_dir,
                 run_id=run_id,
+                workers=os.cpu_count() or 4,
             )
             run_data["install_summary"] = install_summary
             print(
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Long-lived browser connection for repeated nexus_browser_first.py runs.
+
+The daemon connects to the browser over CDP once and keeps that connection
+between runs. `nexus_browser_first.py --use-daemon ...` hands its arguments to
+the daemon, which runs them against the shared browser context and streams
+the console output back. Runs are handled one at a time.
+
+The listener address and a random auth key are written to
+logs/browser-daemon.json (under --log-dir) for clients to find.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import secrets
+import sys
+import threading
+from contextlib import redirect_stdout
+from multiprocessing.connection import AuthenticationError, Client, Connection, Listener
+from pathlib import Path
+from typing import Any, Optional
+
+import nexus_browser_first as baseline
+
+DAEMON_STATE_FILE = "browser-daemon.json"
+
+
+class ConnectionWriter:
+    """Text stream that forwards writes to the client; a vanished client just stops receiving output."""
+
+    def __init__(self, conn: Connection) -> None:
+        self.conn = conn
+        self.broken = False
+        self._lock = threading.Lock()
+
+    def write(self, text: str) -> int:
+        if text and not self.broken:
+            payload = json.dumps({"out": text}).encode("utf-8")
+            with self._lock:
+                try:
+                    self.conn.send_bytes(payload)
+                except OSError:
+                    self.broken = True
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+
+def read_state(log_dir: Path) -> Optional[dict[str, Any]]:
+    try:
+        state = json.loads((log_dir / DAEMON_STATE_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return state if isinstance(state, dict) else None
+
+
+def connect(log_dir: Path) -> Optional[Connection]:
+    state = read_state(log_dir)
+    if state is None:
+        print(f"[!] No browser daemon found ({log_dir / DAEMON_STATE_FILE} missing). Start nexus_browser_daemon.py first.")
+        return None
+    try:
+        return Client((state["host"], int(state["port"])), authkey=bytes.fromhex(state["authkey"]))
+    except (OSError, KeyError, ValueError, AuthenticationError) as exc:
+        print(f"[!] Could not reach browser daemon: {exc}")
+        return None
+
+
+def run_via_daemon(argv: list[str], log_dir: Path) -> int:
+    """Run nexus_browser_first with argv inside the daemon, echoing its output here."""
+    conn = connect(log_dir)
+    if conn is None:
+        return 2
+    with conn:
+        # Relative paths in argv (logs, downloads) should resolve where the client was started.
+        conn.send_bytes(json.dumps({"argv": argv, "cwd": os.getcwd()}).encode("utf-8"))
+        while True:
+            try:
+                message = json.loads(conn.recv_bytes())
+            except (EOFError, OSError):
+                print("\n[!] Browser daemon closed the connection.")
+                return 1
+            if "out" in message:
+                sys.stdout.write(message["out"])
+                continue
+            sys.stdout.flush()
+            return int(message.get("rc", 1))
+
+
+def stop_daemon(log_dir: Path) -> int:
+    conn = connect(log_dir)
+    if conn is None:
+        return 2
+    with conn:
+        conn.send_bytes(json.dumps({"cmd": "stop"}).encode("utf-8"))
+        try:
+            conn.recv_bytes()
+        except (EOFError, OSError):
+            pass
+    print("[+] Browser daemon stopped.")
+    return 0
+
+
+def run_job(conn: Connection, request: dict[str, Any], contexts: dict[str, Any], playwright: Any) -> int:
+    argv = [str(arg) for arg in request.get("argv", [])]
+    writer = ConnectionWriter(conn)
+    previous_cwd = os.getcwd()
+    with redirect_stdout(writer):
+        try:
+            os.chdir(request.get("cwd") or previous_cwd)
+            args = baseline.parse_args(argv)
+            browser, context = contexts.get(args.cdp_url, (None, None))
+            if browser is None or not browser.is_connected():
+                print(f"[i] Daemon connecting to browser: {args.cdp_url}")
+                browser = playwright.chromium.connect_over_cdp(args.cdp_url)
+                context = browser.contexts[0] if browser.contexts else browser.new_context()
+                contexts[args.cdp_url] = (browser, context)
+            return baseline.main(argv, shared_context=context)
+        except SystemExit as exc:
+            # argparse exits on bad arguments; report its code instead of stopping the daemon.
+            return exc.code if isinstance(exc.code, int) else 2
+        except Exception as exc:
+            print(f"[!] Daemon error: {exc}")
+            return 1
+        finally:
+            os.chdir(previous_cwd)
+
+
+def serve(host: str, port: int, log_dir: Path) -> int:
+    from playwright.sync_api import sync_playwright
+
+    log_dir.mkdir(parents=True, exist_ok=True)
+    state_path = log_dir / DAEMON_STATE_FILE
+    authkey = secrets.token_bytes(32)
+    contexts: dict[str, Any] = {}
+    with Listener((host, port), authkey=authkey) as listener, sync_playwright() as p:
+        bound_host, bound_port = listener.address
+        state_path.write_text(
+            json.dumps({"host": bound_host, "port": bound_port, "authkey": authkey.hex(), "pid": os.getpid()}),
+            encoding="utf-8",
+        )
+        # A blocking accept() does not see Ctrl+C on Windows, so point at --stop instead.
+        print(f"[+] Browser daemon listening on {bound_host}:{bound_port}")
+        print(f"[i] Stop it with: python nexus_browser_daemon.py --stop --log-dir {log_dir}")
+        try:
+            while True:
+                try:
+                    conn = listener.accept()
+                except (OSError, AuthenticationError) as exc:
+                    print(f"[!] Rejected connection: {exc}")
+                    continue
+                with conn:
+                    try:
+                        request = json.loads(conn.recv_bytes())
+                    except (EOFError, OSError, ValueError):
+                        continue
+                    if request.get("cmd") == "stop":
+                        conn.send_bytes(json.dumps({"rc": 0}).encode("utf-8"))
+                        break
+                    print(f"[i] Run: {' '.join(map(str, request.get('argv', [])))}")
+                    rc = run_job(conn, request, contexts, p)
+                    print(f"[i] Run finished with exit code {rc}")
+                    try:
+                        conn.send_bytes(json.dumps({"rc": rc}).encode("utf-8"))
+                    except OSError:
+                        pass
+        except KeyboardInterrupt:
+            print("\n[i] Stopping browser daemon.")
+        finally:
+            state_path.unlink(missing_ok=True)
+            for browser, _ in contexts.values():
+                try:
+                    browser.close()
+                except Exception:
+                    pass
+    return 0
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Keep one CDP browser connection open for repeated nexus_browser_first.py --use-daemon runs."
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Address to listen on.")
+    parser.add_argument("--port", type=int, default=0, help="Port to listen on (0 = any free port).")
+    parser.add_argument(
+        "--log-dir",
+        type=Path,
+        default=Path("logs"),
+        help="Directory for the daemon state file; clients look in their own --log-dir.",
+    )
+    parser.add_argument("--stop", action="store_true", help="Stop the running daemon and exit.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    if args.stop:
+        return stop_daemon(args.log_dir)
+    return serve(args.host, args.port, args.log_dir)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
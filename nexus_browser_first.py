@@ -15,38 +15,70 @@ from __future__ import annotations
 
 import asyncio
 import argparse
+import base64
+import concurrent.futures
+import http.client
 import json
+import os
+import queue
 import re
-import shutil
 import ssl
+import string
 import sys
+import threading
 import time
 import urllib.parse
 import urllib.error
 import urllib.request
-from dataclasses import asdict, dataclass
+from contextlib import closing, contextmanager
+from dataclasses import dataclass, fields
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Optional
-from urllib.parse import parse_qs, urlencode, urlparse
+from typing import Any, Iterator, Optional
+from urllib.parse import urlparse
 
-from playwright.sync_api import Error as PlaywrightError
-from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
-from playwright.sync_api import sync_playwright
+try:
+    import orjson
+except ImportError:  # optional: faster parsing of large GraphQL payloads
+    orjson = None
+
+json_loads = orjson.loads if orjson is not None else json.loads
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # optional: event-driven download detection instead of rescanning the folder
+    FileSystemEventHandler = None
+    Observer = None
 
 COLLECTION_URL_RE = re.compile(
-    r"^https?://(?:www\.)?nexusmods\.com/games/[^/]+/collections/[^/?#]+(?:/mods)?/?$",
-    re.IGNORECASE,
+    r"^(https?)://((?:www\.)?nexusmods\.com)/games/([^/]+)/collections/([^/?#]+)(?:/mods)?/?$",
+    re.IGNORECASE | re.ASCII,
 )
 
 MOD_LINK_RE = re.compile(r"^https?://(?:www\.)?nexusmods\.com/[^/]+/mods/\d+/?(?:\?.*)?$", re.IGNORECASE)
 COLLECTION_DOMAIN_RE = re.compile(r"/games/([^/]+)/collections/", re.IGNORECASE)
-MOD_PATH_RE = re.compile(r"^/[^/]+/mods/\d+/?$", re.IGNORECASE)
-GAME_ID_RE = re.compile(r"/images/games/v2/(\d+)/")
+MOD_TARGET_RE = re.compile(
+    r"^https?://(?:www\.)?nexusmods\.com(/([^/?#]+)/mods/(\d+))/*(?:\?([^#]*))?(?:#.*)?$",
+    re.IGNORECASE,
+)
+GAME_IMAGE_PREFIX = "/images/games/v2/"
+CONTENT_DISPOSITION_UTF8_RE = re.compile(r"filename\*=UTF-8''([^;]+)", re.IGNORECASE)
+CONTENT_DISPOSITION_NAME_RE = re.compile(r'filename="?([^";]+)"?', re.IGNORECASE)
 USER_AGENT = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
     "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124 Safari/537.36"
 )
+GENERATE_DOWNLOAD_URL = "https://www.nexusmods.com/Core/Libs/Common/Managers/Downloads?GenerateDownloadUrl"
+DOWNLOAD_URL_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "X-Requested-With": "XMLHttpRequest",
+    "Origin": "https://www.nexusmods.com",
+    "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
+    "Accept": "application/json, text/javascript, */*; q=0.01",
+}
 
 COOKIE_SELECTORS = [
     "button:has-text('Accept')",
@@ -69,11 +101,23 @@ SLOW_SELECTORS = [
     "a:has-text('Free download'):visible",
 ]
 
+# Pre-filter anchors in the page so only plausible mod links cross the CDP wire; Python still normalizes.
+MOD_HREFS_JS = r"""() => {
+    const re = /^https?:\/\/(?:www\.)?nexusmods\.com\/[^\/?#]+\/mods\/\d+(?:[\/?#].*)?$/i;
+    return Array.from(document.querySelectorAll("a[href*='/mods/']"), a => a.href).filter(h => re.test(h));
+}"""
+
+# Visibility of the first 8 matches in one round-trip; mirrors Playwright's is_visible() rules.
+VISIBLE_FLAGS_JS = """els => els.slice(0, 8).map(e => {
+    const r = e.getBoundingClientRect();
+    return r.width > 0 && r.height > 0 && getComputedStyle(e).visibility !== 'hidden';
+})"""
+
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+LOG_BUFFER_SIZE = 64 * 1024
+GRAPHQL_CACHE_FILE = "collection-graphql-cache.json"
 TEMP_DOWNLOAD_EXTENSIONS = {".crdownload", ".part", ".tmp"}
-SUSPICIOUS_FILENAME_RE = re.compile(
-    r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$",
-    re.IGNORECASE,
-)
+_RESERVE_LOCK = threading.Lock()
 
 
 @dataclass
@@ -82,6 +126,22 @@ class ItemResult:
     mod_url: str
     status: str
     reason: str
+    saved_path: Optional[str] = None
+
+
+ITEM_FIELD_NAMES = tuple(f.name for f in fields(ItemResult))
+
+
+def item_to_dict(item: ItemResult) -> dict[str, Any]:
+    return {name: getattr(item, name) for name in ITEM_FIELD_NAMES}
+
+
+@dataclass(frozen=True)
+class ModTarget:
+    url: str
+    domain: str
+    mod_id: int
+    file_id: Optional[int]
 
 
 @dataclass
@@ -89,12 +149,181 @@ class ExtractionResult:
     links: list[str]
     strategy: str
     details: dict[str, Any]
+    replay_request: Optional[dict[str, str]] = None
+    game_id: Optional[int] = None
+
+
+class AdaptiveDelay:
+
+    FLOOR_SEC = 0.2
+    BACKOFF_CAP_SEC = 30.0
+
+    def __init__(self, max_delay_sec: float) -> None:
+        self.max_delay_sec = max(self.FLOOR_SEC, max_delay_sec)
+        self.delay_sec = self.max_delay_sec
+        self.avg_latency_sec: Optional[float] = None
+
+    def observe(self, latency_sec: float, reason: str) -> float:
+        self.avg_latency_sec = (
+            latency_sec if self.avg_latency_sec is None else 0.7 * self.avg_latency_sec + 0.3 * latency_sec
+        )
+        lowered = reason.lower()
+        if "429" in lowered or "too many requests" in lowered or "timeout" in lowered:
+            self.delay_sec = min(self.BACKOFF_CAP_SEC, self.delay_sec * 2)
+        else:
+            base = max(self.FLOOR_SEC, min(self.max_delay_sec, 2 * self.avg_latency_sec))
+            self.delay_sec = max(base, self.delay_sec * 0.9)
+        return self.delay_sec
+
+
+class HttpSession:
+    """Keep-alive HTTP(S) client that reuses one connection per host across mods."""
+
+    REDIRECT_CODES = (301, 302, 303, 307, 308)
+
+    def __init__(self, headers: Optional[dict[str, str]] = None, max_redirects: int = 5) -> None:
+        self.headers = dict(headers or {})
+        self.max_redirects = max_redirects
+        # http.client connections are not thread-safe, so each worker thread keeps its own set.
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._opened: list[http.client.HTTPConnection] = []
+        self._proxies = urllib.request.getproxies()
+
+    def _proxy_for(self, scheme: str, host: str) -> Optional[tuple[str, int, dict[str, str]]]:
+        proxy = self._proxies.get(scheme)
+        if not proxy or urllib.request.proxy_bypass(host):
+            return None
+        parsed = urlparse(proxy if "://" in proxy else f"http://{proxy}")
+        if not parsed.hostname:
+            return None
+        headers: dict[str, str] = {}
+        if parsed.username:
+            credentials = f"{urllib.parse.unquote(parsed.username)}:{urllib.parse.unquote(parsed.password or '')}"
+            headers["Proxy-Authorization"] = "Basic " + base64.b64encode(credentials.encode("utf-8")).decode("ascii")
+        return parsed.hostname, parsed.port or 8080, headers
+
+    def _thread_connections(self) -> dict[tuple[str, str, int, bool], tuple[http.client.HTTPConnection, Any]]:
+        connections = getattr(self._local, "connections", None)
+        if connections is None:
+            connections = {}
+            self._local.connections = connections
+        return connections
+
+    def _connection(
+        self,
+        url: str,
+        timeout: float,
+        ssl_context: Optional[ssl.SSLContext],
+    ) -> tuple[http.client.HTTPConnection, Optional[dict[str, str]]]:
+        parsed = urlparse(url)
+        scheme = parsed.scheme.lower()
+        host = parsed.hostname or ""
+        port = parsed.port or (443 if scheme == "https" else 80)
+        key = (scheme, host, port, ssl_context is None)
+        connections = self._thread_connections()
+        cached = connections.get(key)
+        if cached is not None:
+            conn, proxy_headers = cached
+        else:
+            proxy = self._proxy_for(scheme, host)
+            if scheme == "https":
+                if proxy is not None:
+                    conn = http.client.HTTPSConnection(proxy[0], proxy[1], timeout=timeout, context=ssl_context)
+                    conn.set_tunnel(host, port, headers=proxy[2])
+                else:
+                    conn = http.client.HTTPSConnection(host, port, timeout=timeout, context=ssl_context)
+            elif proxy is not None:
+                conn = http.client.HTTPConnection(proxy[0], proxy[1], timeout=timeout)
+            else:
+                conn = http.client.HTTPConnection(host, port, timeout=timeout)
+            # A plain-HTTP proxy wants an absolute target and credentials on every request.
+            proxy_headers = proxy[2] if scheme == "http" and proxy is not None else None
+            connections[key] = (conn, proxy_headers)
+            with self._lock:
+                self._opened.append(conn)
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn, proxy_headers
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes] = None,
+        headers: Optional[dict[str, str]] = None,
+        timeout: float = 60.0,
+        ssl_context: Optional[ssl.SSLContext] = None,
+    ) -> http.client.HTTPResponse:
+        send_headers = {**self.headers, **(headers or {})}
+        for _ in range(self.max_redirects + 1):
+            conn, proxy_headers = self._connection(url, timeout, ssl_context)
+            parsed = urlparse(url)
+            target = parsed.path or "/"
+            if parsed.query:
+                target = f"{target}?{parsed.query}"
+            request_headers = send_headers
+            if proxy_headers is not None:
+                target = f"{parsed.scheme}://{parsed.netloc}{target}"
+                request_headers = {**send_headers, **proxy_headers}
+            try:
+                conn.request(method, target, body=body, headers=request_headers)
+            except (http.client.HTTPException, ConnectionError):
+                # Stale keep-alive socket or an unread previous response: the request never got out.
+                conn.close()
+                conn.request(method, target, body=body, headers=request_headers)
+            try:
+                response = conn.getresponse()
+            except (http.client.HTTPException, ConnectionError):
+                # The server may already have acted on the request; only a GET is safe to send twice.
+                conn.close()
+                if method != "GET":
+                    raise
+                conn.request(method, target, body=body, headers=request_headers)
+                response = conn.getresponse()
+
+            if response.status in self.REDIRECT_CODES and response.getheader("Location"):
+                response.read()
+                url = urllib.parse.urljoin(url, response.getheader("Location", ""))
+                if response.status == 303 or (response.status in (301, 302) and method == "POST"):
+                    method = "GET"
+                    body = None
+                    send_headers = {
+                        k: v for k, v in send_headers.items() if k.lower() not in ("content-type", "content-length")
+                    }
+                continue
+            if response.status >= 400:
+                response.read()
+                raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, None)
+            return response
+        raise RuntimeError(f"Too many redirects: {url}")
+
+    def close(self) -> None:
+        with self._lock:
+            for conn in self._opened:
+                conn.close()
+
+
+DEFAULT_SESSION = HttpSession()
+
+
+def _quiet(*_args: Any, **_kwargs: Any) -> None:
+    return None
+
+
+_COOKIE_NAME_VALUE = itemgetter("name", "value")
+
+
+def cookie_header_from(cookies: list[dict[str, Any]]) -> str:
+    return "; ".join("=".join(_COOKIE_NAME_VALUE(c)) for c in sorted(cookies, key=itemgetter("name")))
 
 
 def now_stamp() -> str:
     return datetime.now().strftime("%Y%m%d-%H%M%S")
 
 
+@lru_cache(maxsize=8)
 def clean_collection_url(url: str) -> str:
     parsed = urlparse(url.strip())
     base = f"{parsed.scheme}://{parsed.netloc}{parsed.path}".rstrip("/")
@@ -103,91 +332,150 @@ def clean_collection_url(url: str) -> str:
     return base
 
 
+def parse_and_clean_collection_url(url: str) -> Optional[str]:
+    m = COLLECTION_URL_RE.match(url)
+    if not m:
+        return None
+    scheme, netloc, game, slug = m.groups()
+    return f"{scheme.lower()}://{netloc}/games/{game}/collections/{slug}/mods"
+
+
 def click_first_visible(page: Any, selectors: list[str], timeout_sec: float) -> Optional[str]:
+    from playwright.sync_api import Error as PlaywrightError
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+    locators = [(selector, page.locator(selector)) for selector in selectors]
     deadline = time.time() + timeout_sec
     while time.time() < deadline:
-        for selector in selectors:
-            locator = page.locator(selector)
+        for selector, locator in locators:
             try:
-                count = locator.count()
-                if count <= 0:
-                    continue
-                limit = min(count, 8)
-                for i in range(limit):
-                    target = locator.nth(i)
-                    if target.is_visible():
-                        target.click(timeout=1500)
-                        return selector
+                visible = locator.evaluate_all(VISIBLE_FLAGS_JS)
+                if True in visible:
+                    locator.nth(visible.index(True)).click(timeout=1500)
+                    return selector
             except (PlaywrightTimeoutError, PlaywrightError):
                 continue
         page.wait_for_timeout(250)
     return None
 
 
+def _scan_files(download_dir: Path) -> dict[Path, float]:
+    try:
+        with os.scandir(download_dir) as it:
+            return {Path(entry.path): entry.stat().st_mtime for entry in it if entry.is_file()}
+    except FileNotFoundError:
+        return {}
+
+
 def list_candidate_files(download_dir: Path) -> list[Path]:
-    if not download_dir.exists():
-        return []
-    return [p for p in download_dir.iterdir() if p.is_file()]
+    return list(_scan_files(download_dir))
 
 
 def is_temp_download(path: Path) -> bool:
     return path.suffix.lower() in TEMP_DOWNLOAD_EXTENSIONS
 
 
-def wait_until_file_is_stable(path: Path, checks: int = 3, interval_sec: float = 1.0) -> bool:
-    if not path.exists() or is_temp_download(path):
+def wait_until_file_is_stable(path: Path) -> bool:
+    if is_temp_download(path):
         return False
-    sizes = []
-    for _ in range(checks):
-        if not path.exists():
+    try:
+        if path.stat().st_size <= 0:
             return False
-        sizes.append(path.stat().st_size)
-        time.sleep(interval_sec)
-    return len(set(sizes)) == 1
+    except OSError:
+        return False
+    return not any(path.with_name(path.name + ext).exists() for ext in TEMP_DOWNLOAD_EXTENSIONS)
 
 
-def wait_for_new_completed_download(download_dir: Path, baseline: set[Path], timeout_sec: int) -> Optional[Path]:
-    start = time.time()
+def find_new_completed_download(
+    download_dir: Path,
+    baseline: set[Path],
+    claimed: Optional[set[Path]] = None,
+) -> Optional[Path]:
+    current = _scan_files(download_dir)
+    new_files = [p for p in current.keys() - baseline if not is_temp_download(p)]
+    if claimed:
+        # Read after the scan: a direct download reserves its path before the file can appear.
+        new_files = [p for p in new_files if p not in claimed]
+    for path in sorted(new_files, key=current.__getitem__, reverse=True):
+        if wait_until_file_is_stable(path):
+            return path
+    return None
+
+
+def wait_for_new_completed_download(
+    download_dir: Path,
+    baseline: set[Path],
+    timeout_sec: int,
+    claimed: Optional[set[Path]] = None,
+) -> Optional[Path]:
+    deadline = time.monotonic() + timeout_sec
     while True:
-        current = set(list_candidate_files(download_dir))
-        new_files = [p for p in current - baseline if not is_temp_download(p)]
-        for path in sorted(new_files, key=lambda p: p.stat().st_mtime, reverse=True):
-            if wait_until_file_is_stable(path):
-                return path
-        if time.time() - start > timeout_sec:
-            return None
+        path = find_new_completed_download(download_dir, baseline, claimed)
+        if path is not None or time.monotonic() >= deadline:
+            return path
         time.sleep(1.0)
 
 
-def is_good_archive_name(name: str) -> bool:
-    lower = name.lower()
-    if lower.endswith((".zip", ".7z", ".rar")):
+class DownloadWatcher:
+    def __init__(self, download_dir: Path) -> None:
+        self.download_dir = download_dir
+        self._generation = 0
+        self._observer: Any = None
+
+    def start(self) -> bool:
+        if Observer is None:
+            return False
+        watcher = self
+
+        class _Handler(FileSystemEventHandler):
+            def on_any_event(self, event: Any) -> None:
+                watcher._generation += 1
+
+        try:
+            self.download_dir.mkdir(parents=True, exist_ok=True)
+            observer = Observer()
+            observer.schedule(_Handler(), str(self.download_dir), recursive=False)
+            observer.daemon = True
+            observer.start()
+        except Exception:
+            return False
+        self._observer = observer
         return True
-    stem = Path(name).name
-    if SUSPICIOUS_FILENAME_RE.match(stem):
-        return False
-    return False
+
+    def generation(self) -> Optional[int]:
+        return self._generation if self._observer is not None else None
+
+    def stop(self) -> None:
+        observer, self._observer = self._observer, None
+        if observer is not None:
+            observer.stop()
+            observer.join(timeout=2)
+
+
+def is_good_archive_name(name: str) -> bool:
+    return name.lower().endswith((".zip", ".7z", ".rar"))
 
 
 def extract_game_id(html: str) -> Optional[int]:
-    m = GAME_ID_RE.search(html)
-    if m:
-        return int(m.group(1))
+    prefix_len = len(GAME_IMAGE_PREFIX)
+    start = html.find(GAME_IMAGE_PREFIX)
+    while start >= 0:
+        begin = end = start + prefix_len
+        while end < len(html) and "0" <= html[end] <= "9":
+            end += 1
+        if end > begin and html.startswith("/", end):
+            return int(html[begin:end])
+        start = html.find(GAME_IMAGE_PREFIX, begin)
     return None
 
 
 def extract_mod_links(page: Any) -> list[str]:
-    links = page.locator("a[href*='/mods/']").evaluate_all("els => els.map(e => e.href)")
-    normalized: list[str] = []
-    for href in links:
-        if not isinstance(href, str):
-            continue
-        target = normalize_mod_target_url(href)
-        if target is not None:
-            normalized.append(target)
-    return dedupe_links(normalized)
+    links = page.evaluate(MOD_HREFS_JS)
+    normalized = (normalize_mod_target_url(href) for href in links if isinstance(href, str))
+    return dedupe_links([target for target in normalized if target is not None])
 
 
+@lru_cache(maxsize=8)
 def extract_collection_domain(collection_url: str) -> Optional[str]:
     m = COLLECTION_DOMAIN_RE.search(collection_url)
     if not m:
@@ -196,98 +484,45 @@ def extract_collection_domain(collection_url: str) -> Optional[str]:
 
 
 def dedupe_links(links: list[str]) -> list[str]:
-    seen: set[str] = set()
-    out: list[str] = []
-    for link in links:
-        canonical = normalize_mod_target_url(link)
-        if canonical is None:
-            continue
-        if canonical in seen:
-            continue
-        seen.add(canonical)
-        out.append(canonical)
-    return out
+    return list(dict.fromkeys(link for link in links if link))
 
 
-def normalize_mod_target_url(url: str) -> Optional[str]:
-    try:
-        parsed = urlparse(url)
-    except Exception:
-        return None
-    if parsed.scheme not in ("http", "https"):
-        return None
-    if parsed.netloc.lower() not in ("www.nexusmods.com", "nexusmods.com"):
-        return None
-    path = parsed.path.rstrip("/")
-    if not MOD_PATH_RE.match(path):
+@lru_cache(maxsize=8192)
+def mod_target(url: str) -> Optional[ModTarget]:
+    m = MOD_TARGET_RE.match(url)
+    if not m:
         return None
-    query = parse_qs(parsed.query)
-    file_id_values = query.get("file_id", [])
+    path, domain, mod_id, query = m.groups()
     file_id: Optional[int] = None
-    if file_id_values:
-        try:
-            file_id = int(file_id_values[0])
-        except (TypeError, ValueError):
-            file_id = None
+    if query and "file_id=" in query:
+        for pair in query.split("&"):
+            key, _, value = pair.partition("=")
+            if key == "file_id" and value:
+                try:
+                    file_id = int(value)
+                except ValueError:
+                    file_id = None
+                break
     base = f"https://www.nexusmods.com{path}"
     if file_id is not None and file_id > 0:
-        return f"{base}?{urlencode({'tab': 'files', 'file_id': file_id})}"
-    return base
+        return ModTarget(f"{base}?tab=files&file_id={file_id}", domain.lower(), int(mod_id), file_id)
+    return ModTarget(base, domain.lower(), int(mod_id), None)
+
+
+def normalize_mod_target_url(url: str) -> Optional[str]:
+    target = mod_target(url)
+    return target.url if target is not None else None
 
 
 def parse_mod_target(url: str) -> tuple[Optional[str], Optional[int], Optional[int]]:
-    normalized = normalize_mod_target_url(url)
-    if not normalized:
+    target = mod_target(url)
+    if target is None:
         return None, None, None
-    parsed = urlparse(normalized)
-    parts = parsed.path.strip("/").split("/")
-    if len(parts) < 3 or parts[1] != "mods":
-        return None, None, None
-    domain = parts[0].lower()
-    try:
-        mod_id = int(parts[2])
-    except ValueError:
-        return None, None, None
-    q = parse_qs(parsed.query)
-    try:
-        file_id = int(q["file_id"][0]) if "file_id" in q and q["file_id"] else None
-    except (TypeError, ValueError):
-        file_id = None
-    return domain, mod_id, file_id
-
+    return target.domain, target.mod_id, target.file_id
 
-def resolve_download_url_via_web(cookie_header: str, mod_url: str, game_id: int, file_id: int) -> str:
-    req = urllib.request.Request(
-        "https://www.nexusmods.com/Core/Libs/Common/Managers/Downloads?GenerateDownloadUrl",
-        data=urllib.parse.urlencode({"fid": str(file_id), "game_id": str(game_id)}).encode("utf-8"),
-        headers={
-            "User-Agent": USER_AGENT,
-            "Cookie": cookie_header,
-            "X-Requested-With": "XMLHttpRequest",
-            "Origin": "https://www.nexusmods.com",
-            "Referer": mod_url,
-            "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
-            "Accept": "application/json, text/javascript, */*; q=0.01",
-        },
-        method="POST",
-    )
-    with urllib.request.urlopen(req, timeout=60) as response:
-        raw = response.read().decode("utf-8", errors="replace")
 
-    parsed = json.loads(raw)
-    if isinstance(parsed, dict):
-        for key in ("url", "URI", "uri"):
-            value = parsed.get(key)
-            if isinstance(value, str) and value.strip():
-                return normalize_download_url(value)
-    if isinstance(parsed, list):
-        for entry in parsed:
-            if isinstance(entry, dict):
-                for key in ("url", "URI", "uri"):
-                    value = entry.get(key)
-                    if isinstance(value, str) and value.strip():
-                        return normalize_download_url(value)
-    raise RuntimeError(f"Unexpected download URL payload: {raw[:200]}")
+_PATH_SAFE_CHARS = frozenset(string.ascii_letters + string.digits + "/._-~")
+_QUERY_SAFE_CHARS = frozenset(string.ascii_letters + string.digits + "=&:_.-~")
 
 
 def normalize_download_url(raw_url: str) -> str:
@@ -303,17 +538,21 @@ def normalize_download_url(raw_url: str) -> str:
         value = urllib.parse.urljoin("https://www.nexusmods.com", value)
         parsed = urlparse(value)
 
-    path = urllib.parse.quote(parsed.path, safe="/._-~")
-    query = urllib.parse.quote_plus(parsed.query, safe="=&:_-~")
+    path = parsed.path
+    if not _PATH_SAFE_CHARS.issuperset(path):
+        path = urllib.parse.quote(path, safe="/._-~")
+    query = parsed.query
+    if not _QUERY_SAFE_CHARS.issuperset(query):
+        query = urllib.parse.quote_plus(query, safe="=&:_-~")
     return urllib.parse.urlunparse((parsed.scheme, parsed.netloc, path, "", query, ""))
 
 
 def filename_from_response_headers(url: str, headers: Any, fallback_name: str) -> str:
     content_disposition = headers.get("Content-Disposition", "") if headers else ""
-    m_utf = re.search(r"filename\\*=UTF-8''([^;]+)", content_disposition, flags=re.IGNORECASE)
+    m_utf = CONTENT_DISPOSITION_UTF8_RE.search(content_disposition)
     if m_utf:
         return urllib.parse.unquote(m_utf.group(1))
-    m_std = re.search(r'filename="?([^";]+)"?', content_disposition, flags=re.IGNORECASE)
+    m_std = CONTENT_DISPOSITION_NAME_RE.search(content_disposition)
     if m_std:
         return m_std.group(1).strip()
     path_name = Path(urllib.parse.urlparse(url).path).name
@@ -322,59 +561,54 @@ def filename_from_response_headers(url: str, headers: Any, fallback_name: str) -
     return fallback_name
 
 
+def _path_taken(path: Path) -> bool:
+    return path.exists() or path.with_suffix(path.suffix + ".part").exists()
+
+
 def unique_path(path: Path) -> Path:
-    if not path.exists():
+    if not _path_taken(path):
         return path
     stem = path.stem
     suffix = path.suffix
     for i in range(1, 10000):
         candidate = path.with_name(f"{stem} ({i}){suffix}")
-        if not candidate.exists():
+        if not _path_taken(candidate):
             return candidate
     raise RuntimeError(f"Could not create unique path for {path}")
 
 
-def direct_download_to_folder(url: str, download_dir: Path, fallback_name: str) -> Path:
-    download_dir.mkdir(parents=True, exist_ok=True)
-    req = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
-    with urllib.request.urlopen(req, timeout=180) as response:
-        file_name = filename_from_response_headers(url, response.headers, fallback_name)
-        file_name = file_name.strip() or fallback_name
-        if not Path(file_name).suffix:
-            file_name = file_name + ".zip"
-        target = unique_path(download_dir / file_name)
+def reserve_download_path(path: Path, claimed: Optional[set[Path]] = None) -> tuple[Path, Path]:
+    """Pick a free target name and create its .part file atomically across download threads."""
+    with _RESERVE_LOCK:
+        target = unique_path(path)
         temp = target.with_suffix(target.suffix + ".part")
-        with temp.open("wb") as fh:
-            shutil.copyfileobj(response, fh, length=1024 * 1024)
-    temp.replace(target)
-    return target
+        temp.touch()
+        if claimed is not None:
+            claimed.add(target)
+    return target, temp
 
 
-def resolve_download_url_via_web_with_context(
+def resolve_download_url_via_web(
     cookie_header: str,
     mod_url: str,
     game_id: int,
     file_id: int,
-    ssl_context: Optional[ssl.SSLContext],
+    ssl_context: Optional[ssl.SSLContext] = None,
+    session: Optional[HttpSession] = None,
 ) -> str:
-    req = urllib.request.Request(
-        "https://www.nexusmods.com/Core/Libs/Common/Managers/Downloads?GenerateDownloadUrl",
-        data=urllib.parse.urlencode({"fid": str(file_id), "game_id": str(game_id)}).encode("utf-8"),
-        headers={
-            "User-Agent": USER_AGENT,
-            "Cookie": cookie_header,
-            "X-Requested-With": "XMLHttpRequest",
-            "Origin": "https://www.nexusmods.com",
-            "Referer": mod_url,
-            "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
-            "Accept": "application/json, text/javascript, */*; q=0.01",
-        },
-        method="POST",
+    client = session or DEFAULT_SESSION
+    response = client.request(
+        "POST",
+        GENERATE_DOWNLOAD_URL,
+        body=f"fid={int(file_id)}&game_id={int(game_id)}".encode("ascii"),
+        headers={**DOWNLOAD_URL_HEADERS, "Cookie": cookie_header, "Referer": mod_url},
+        timeout=60,
+        ssl_context=ssl_context,
     )
-    with urllib.request.urlopen(req, timeout=60, context=ssl_context) as response:
+    with response:
         raw = response.read().decode("utf-8", errors="replace")
 
-    parsed = json.loads(raw)
+    parsed = json_loads(raw)
     if isinstance(parsed, dict):
         for key in ("url", "URI", "uri"):
             value = parsed.get(key)
@@ -390,76 +624,145 @@ def resolve_download_url_via_web_with_context(
     raise RuntimeError(f"Unexpected download URL payload: {raw[:200]}")
 
 
-def direct_download_to_folder_with_context(
+def direct_download_to_folder(
     url: str,
     download_dir: Path,
     fallback_name: str,
-    ssl_context: Optional[ssl.SSLContext],
+    ssl_context: Optional[ssl.SSLContext] = None,
+    session: Optional[HttpSession] = None,
+    claimed: Optional[set[Path]] = None,
+    cancel: Optional[threading.Event] = None,
 ) -> Path:
     download_dir.mkdir(parents=True, exist_ok=True)
-    req = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
-    with urllib.request.urlopen(req, timeout=180, context=ssl_context) as response:
+    client = session or DEFAULT_SESSION
+    response = client.request("GET", url, headers={"User-Agent": USER_AGENT}, timeout=180, ssl_context=ssl_context)
+    with response:
         file_name = filename_from_response_headers(url, response.headers, fallback_name)
         file_name = file_name.strip() or fallback_name
         if not Path(file_name).suffix:
             file_name = file_name + ".zip"
-        target = unique_path(download_dir / file_name)
-        temp = target.with_suffix(target.suffix + ".part")
-        with temp.open("wb") as fh:
-            shutil.copyfileobj(response, fh, length=1024 * 1024)
+        target, temp = reserve_download_path(download_dir / file_name, claimed)
+        try:
+            with temp.open("wb") as fh:
+                copy_response_to_file(response, fh, cancel)
+        except DownloadCancelled:
+            temp.unlink(missing_ok=True)
+            raise
     temp.replace(target)
     return target
 
 
+class DownloadCancelled(RuntimeError):
+    pass
+
+
+def copy_response_to_file(
+    response: http.client.HTTPResponse,
+    fh: Any,
+    cancel: Optional[threading.Event] = None,
+) -> int:
+    expected = response.length
+    preallocated = False
+    if expected and hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(fh.fileno(), 0, expected)
+            preallocated = True
+        except OSError:
+            pass
+    view = memoryview(bytearray(DOWNLOAD_CHUNK_SIZE))
+    written = 0
+    while True:
+        if cancel is not None and cancel.is_set():
+            raise DownloadCancelled("download cancelled")
+        n = response.readinto(view)
+        if not n:
+            break
+        fh.write(view[:n])
+        written += n
+    if preallocated:
+        fh.truncate(written)
+    return written
+
+
 def is_ssl_verify_error(exc: Exception) -> bool:
     text = str(exc).lower()
     return "certificate verify failed" in text or "self-signed certificate" in text
 
 
 def links_from_collection_payload(payload: Any, domain: Optional[str]) -> list[str]:
-    if not isinstance(payload, dict):
+    data = payload.get("data") if isinstance(payload, dict) else None
+    revision = data.get("collectionRevision") if isinstance(data, dict) else None
+    mod_files = revision.get("modFiles") if isinstance(revision, dict) else None
+    if not domain or not isinstance(mod_files, list):
         return []
 
-    data = payload.get("data")
-    if not isinstance(data, dict):
-        return []
-    revision = data.get("collectionRevision")
-    if not isinstance(revision, dict):
-        return []
+    prefix = f"https://www.nexusmods.com/{domain}/mods/"
+    if all(
+        type(entry) is dict
+        and type(entry.get("modId")) is int
+        and type(entry.get("fileId")) is int
+        and entry["modId"] >= 0
+        and entry["fileId"] > 0
+        for entry in mod_files
+    ):
+        return dedupe_links([f"{prefix}{entry['modId']}?tab=files&file_id={entry['fileId']}" for entry in mod_files])
 
     links: list[str] = []
-    mod_files = revision.get("modFiles")
-    if isinstance(mod_files, list):
-        for entry in mod_files:
-            if not isinstance(entry, dict):
-                continue
-            mod_id = entry.get("modId")
-            file_id = entry.get("fileId")
-            if mod_id is None and isinstance(entry.get("file"), dict):
-                mod_obj = entry["file"].get("mod")
-                if isinstance(mod_obj, dict):
-                    mod_id = mod_obj.get("modId") or mod_obj.get("id")
-                file_obj = entry.get("file")
-                if isinstance(file_obj, dict):
-                    file_id = file_id or file_obj.get("fileId") or file_obj.get("id")
-            try:
-                mod_id_int = int(mod_id)
-            except (TypeError, ValueError):
-                continue
-            try:
-                file_id_int = int(file_id) if file_id is not None else None
-            except (TypeError, ValueError):
-                file_id_int = None
-            if domain:
-                if file_id_int is not None and file_id_int > 0:
-                    links.append(
-                        f"https://www.nexusmods.com/{domain}/mods/{mod_id_int}?{urlencode({'tab': 'files', 'file_id': file_id_int})}"
-                    )
-                else:
-                    links.append(f"https://www.nexusmods.com/{domain}/mods/{mod_id_int}")
+    for entry in mod_files:
+        if not isinstance(entry, dict):
+            continue
+        mod_id = entry.get("modId")
+        file_id = entry.get("fileId")
+        file_obj = entry.get("file")
+        if mod_id is None and isinstance(file_obj, dict):
+            mod_obj = file_obj.get("mod")
+            if isinstance(mod_obj, dict):
+                mod_id = mod_obj.get("modId") or mod_obj.get("id")
+            file_id = file_id or file_obj.get("fileId") or file_obj.get("id")
+        try:
+            mod_id_int = int(mod_id)
+        except (TypeError, ValueError):
+            continue
+        if mod_id_int < 0:
+            continue
+        try:
+            file_id_int = int(file_id) if file_id is not None else None
+        except (TypeError, ValueError):
+            file_id_int = None
+        if file_id_int is not None and file_id_int > 0:
+            links.append(f"{prefix}{mod_id_int}?tab=files&file_id={file_id_int}")
+        else:
+            links.append(f"{prefix}{mod_id_int}")
     return dedupe_links(links)
 
 
+def game_id_from_collection_payload(payload: Any) -> Optional[int]:
+    data = payload.get("data") if isinstance(payload, dict) else None
+    revision = data.get("collectionRevision") if isinstance(data, dict) else None
+    if not isinstance(revision, dict):
+        return None
+    candidates: list[Any] = [revision.get("game"), revision.get("gameId")]
+    collection = revision.get("collection")
+    if isinstance(collection, dict):
+        candidates += [collection.get("game"), collection.get("gameId")]
+    mod_files = revision.get("modFiles")
+    if isinstance(mod_files, list) and mod_files and isinstance(mod_files[0], dict):
+        file_obj = mod_files[0].get("file")
+        if isinstance(file_obj, dict):
+            candidates.append(file_obj.get("game"))
+            mod_obj = file_obj.get("mod")
+            if isinstance(mod_obj, dict):
+                candidates += [mod_obj.get("game"), mod_obj.get("gameId")]
+    for candidate in candidates:
+        if isinstance(candidate, dict):
+            candidate = candidate.get("id")
+        if isinstance(candidate, int) and candidate > 0:
+            return candidate
+        if isinstance(candidate, str) and candidate.isdigit():
+            return int(candidate)
+    return None
+
+
 def collect_links_via_network(page: Any, collection_url: str, wait_ms: int = 12000) -> ExtractionResult:
     domain = extract_collection_domain(collection_url)
     payload_candidates: list[dict[str, Any]] = []
@@ -486,13 +789,14 @@ def collect_links_via_network(page: Any, collection_url: str, wait_ms: int = 120
                     }
                 )
                 return
-            body = response.json()
+            body = json_loads(response.body())
             payload_candidates.append(
                 {
                     "source": "graphql_200",
                     "status": response.status,
                     "url": response.url,
                     "operation": op_header,
+                    "post_data": post_data,
                     "body": body,
                 }
             )
@@ -512,12 +816,23 @@ def collect_links_via_network(page: Any, collection_url: str, wait_ms: int = 120
 
     links: list[str] = []
     matched_payloads = 0
+    game_id: Optional[int] = None
+    requests_with_links: dict[str, dict[str, str]] = {}
     for candidate in payload_candidates:
         body = candidate.get("body")
         if body is None:
             continue
         matched_payloads += 1
-        links.extend(links_from_collection_payload(body, domain))
+        if game_id is None:
+            game_id = game_id_from_collection_payload(body)
+        payload_links = links_from_collection_payload(body, domain)
+        links.extend(payload_links)
+        if payload_links and candidate["post_data"]:
+            requests_with_links[candidate["post_data"]] = {
+                "url": candidate["url"],
+                "operation": candidate["operation"],
+                "post_data": candidate["post_data"],
+            }
 
     links = dedupe_links(links)
     details = {
@@ -525,7 +840,97 @@ def collect_links_via_network(page: Any, collection_url: str, wait_ms: int = 120
         "payloads_parsed": matched_payloads,
         "domain": domain,
     }
-    return ExtractionResult(links=links, strategy="network_graphql", details=details)
+    # A paginated list needs every page, so only a single query that returned the whole queue is replayable.
+    replay = next(iter(requests_with_links.values())) if len(requests_with_links) == 1 else None
+    return ExtractionResult(
+        links=links,
+        strategy="network_graphql",
+        details=details,
+        replay_request=replay,
+        game_id=game_id,
+    )
+
+
+def collect_links_via_graphql(
+    replay: dict[str, str],
+    collection_url: str,
+    cookie_header: str,
+    session: Optional[HttpSession] = None,
+) -> tuple[list[str], Optional[int]]:
+    """Re-send a previously observed collection GraphQL query without loading the page."""
+    body = replay["post_data"]
+    try:
+        query = json_loads(body)
+    except ValueError:
+        query = None
+    if isinstance(query, dict) and isinstance(query.get("variables"), dict):
+        # The page asks for the latest revision; drop a pinned one so the cache never serves a stale list.
+        if query["variables"].pop("revision", None) is not None:
+            body = json.dumps(query)
+    client = session or DEFAULT_SESSION
+    response = client.request(
+        "POST",
+        replay["url"],
+        body=body.encode("utf-8"),
+        headers={
+            "User-Agent": USER_AGENT,
+            "Cookie": cookie_header,
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            "Origin": "https://www.nexusmods.com",
+            "Referer": collection_url,
+            "x-graphql-operationname": replay.get("operation") or "CollectionRevisionMods",
+        },
+        timeout=30,
+    )
+    with response:
+        payload = json_loads(response.read())
+    links = links_from_collection_payload(payload, extract_collection_domain(collection_url))
+    return links, game_id_from_collection_payload(payload)
+
+
+def load_graphql_cache(cache_path: Path) -> dict[str, Any]:
+    try:
+        data = json_loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def collect_collection_links(
+    page: Any,
+    collection_url: str,
+    cookie_header: str,
+    cache_path: Path,
+    session: Optional[HttpSession] = None,
+) -> tuple[ExtractionResult, Optional[int]]:
+    """Return (extraction, game_id), replaying a cached GraphQL query before falling back to the page."""
+    cache = load_graphql_cache(cache_path)
+    entry = cache.get(collection_url)
+    # Without session cookies the replay can silently return a shorter list (adult or hidden mods).
+    if cookie_header and isinstance(entry, dict) and isinstance(entry.get("request"), dict):
+        try:
+            links, game_id = collect_links_via_graphql(entry["request"], collection_url, cookie_header, session)
+        except Exception as e:
+            print(f"[i] Cached GraphQL query failed: {e}. Loading the collection page instead...")
+            links, game_id = [], None
+        if game_id is None and isinstance(entry.get("game_id"), int):
+            game_id = entry["game_id"]
+        if links and game_id is not None:
+            details = {"links_found": len(links), "cache": str(cache_path)}
+            extraction = ExtractionResult(links=links, strategy="graphql_replay", details=details, game_id=game_id)
+            return extraction, game_id
+
+    extraction = collect_links_via_network(page, collection_url)
+    game_id = extraction.game_id if extraction.game_id is not None else extract_game_id(page.content())
+    if extraction.replay_request is not None:
+        cache[collection_url] = {"request": extraction.replay_request, "game_id": game_id}
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(json.dumps(cache, indent=2), encoding="utf-8")
+        except OSError:
+            pass
+    return extraction, game_id
 
 
 def write_zero_queue_artifacts(page: Any, log_dir: Path, run_id: str) -> dict[str, str]:
@@ -555,6 +960,78 @@ def write_zero_queue_artifacts(page: Any, log_dir: Path, run_id: str) -> dict[st
     return out
 
 
+def try_direct_download(
+    mod_url: str,
+    downloads_dir: Path,
+    cookie_header: Optional[str],
+    game_id: Optional[int],
+    session: Optional[HttpSession] = None,
+    verbose: bool = True,
+    claimed: Optional[set[Path]] = None,
+    cancel: Optional[threading.Event] = None,
+) -> Optional[ItemResult]:
+    """Download a mod over plain HTTP without the browser; None means use the click flow."""
+    log = print if verbose else _quiet
+    files_url = mod_url if "file_id=" in mod_url else f"{mod_url}?tab=files"
+    domain_name, mod_id, file_id = parse_mod_target(mod_url)
+    if not (cookie_header and game_id and file_id and mod_id and domain_name):
+        return None
+
+    log("[i] Trying direct session download URL...")
+    try:
+        direct_url = resolve_download_url_via_web(
+            cookie_header,
+            files_url,
+            game_id,
+            file_id,
+            ssl_context=None,
+            session=session,
+        )
+        downloaded = direct_download_to_folder(
+            direct_url,
+            downloads_dir,
+            fallback_name=f"{domain_name}-{mod_id}-{file_id}.zip",
+            ssl_context=None,
+            session=session,
+            claimed=claimed,
+            cancel=cancel,
+        )
+        if is_good_archive_name(downloaded.name):
+            return ItemResult(0, mod_url, "ok", f"direct_download:{downloaded}", str(downloaded))
+        return ItemResult(0, mod_url, "partial", f"direct_download_suspicious:{downloaded.name}")
+    except Exception as e:
+        if not is_ssl_verify_error(e):
+            log(f"[i] Direct session download failed: {e}. Falling back to click flow...")
+            return None
+
+    log("[i] Direct download hit SSL verify issue. Retrying with insecure SSL context...")
+    try:
+        insecure_ctx = ssl._create_unverified_context()
+        direct_url = resolve_download_url_via_web(
+            cookie_header,
+            files_url,
+            game_id,
+            file_id,
+            ssl_context=insecure_ctx,
+            session=session,
+        )
+        downloaded = direct_download_to_folder(
+            direct_url,
+            downloads_dir,
+            fallback_name=f"{domain_name}-{mod_id}-{file_id}.zip",
+            ssl_context=insecure_ctx,
+            session=session,
+            claimed=claimed,
+            cancel=cancel,
+        )
+        if is_good_archive_name(downloaded.name):
+            return ItemResult(0, mod_url, "ok", f"direct_download_insecure_ssl:{downloaded}", str(downloaded))
+        return ItemResult(0, mod_url, "partial", f"direct_download_suspicious:{downloaded.name}")
+    except Exception as e2:
+        log(f"[i] Insecure SSL retry failed: {e2}. Falling back to click flow...")
+        return None
+
+
 def process_mod(
     page: Any,
     mod_url: str,
@@ -565,54 +1042,20 @@ def process_mod(
     download_timeout_sec: int,
     cookie_header: Optional[str],
     game_id: Optional[int],
+    session: Optional[HttpSession] = None,
+    verbose: bool = True,
+    skip_direct: bool = False,
+    watcher: Optional[DownloadWatcher] = None,
+    claimed_paths: Optional[set[Path]] = None,
+    scan_folder: bool = True,
 ) -> ItemResult:
+    log = print if verbose else _quiet
     files_url = mod_url if "file_id=" in mod_url else f"{mod_url}?tab=files"
-    domain_name, mod_id, file_id = parse_mod_target(mod_url)
 
-    if verify_downloads and cookie_header and game_id and file_id and mod_id and domain_name:
-        print("[i] Trying direct session download URL...")
-        try:
-            direct_url = resolve_download_url_via_web_with_context(
-                cookie_header,
-                files_url,
-                game_id,
-                file_id,
-                ssl_context=None,
-            )
-            downloaded = direct_download_to_folder_with_context(
-                direct_url,
-                downloads_dir,
-                fallback_name=f"{domain_name}-{mod_id}-{file_id}.zip",
-                ssl_context=None,
-            )
-            if is_good_archive_name(downloaded.name):
-                return ItemResult(0, mod_url, "ok", f"direct_download:{downloaded}")
-            return ItemResult(0, mod_url, "partial", f"direct_download_suspicious:{downloaded.name}")
-        except Exception as e:
-            if is_ssl_verify_error(e):
-                print("[i] Direct download hit SSL verify issue. Retrying with insecure SSL context...")
-                try:
-                    insecure_ctx = ssl._create_unverified_context()
-                    direct_url = resolve_download_url_via_web_with_context(
-                        cookie_header,
-                        files_url,
-                        game_id,
-                        file_id,
-                        ssl_context=insecure_ctx,
-                    )
-                    downloaded = direct_download_to_folder_with_context(
-                        direct_url,
-                        downloads_dir,
-                        fallback_name=f"{domain_name}-{mod_id}-{file_id}.zip",
-                        ssl_context=insecure_ctx,
-                    )
-                    if is_good_archive_name(downloaded.name):
-                        return ItemResult(0, mod_url, "ok", f"direct_download_insecure_ssl:{downloaded}")
-                    return ItemResult(0, mod_url, "partial", f"direct_download_suspicious:{downloaded.name}")
-                except Exception as e2:
-                    print(f"[i] Insecure SSL retry failed: {e2}. Falling back to click flow...")
-            else:
-                print(f"[i] Direct session download failed: {e}. Falling back to click flow...")
+    if verify_downloads and not dry_run and not skip_direct:
+        direct = try_direct_download(mod_url, downloads_dir, cookie_header, game_id, session, verbose)
+        if direct is not None:
+            return direct
 
     nav_error: Optional[str] = None
     for _ in range(2):
@@ -648,8 +1091,12 @@ def process_mod(
         seen_downloads.append(str(name))
         try:
             downloads_dir.mkdir(parents=True, exist_ok=True)
-            target = unique_path(downloads_dir / str(name))
-            download.save_as(str(target))
+            # Shares _RESERVE_LOCK with direct downloads and other workers so no two pick the same name.
+            target, placeholder = reserve_download_path(downloads_dir / str(name))
+            try:
+                download.save_as(str(target))
+            finally:
+                placeholder.unlink(missing_ok=True)
             saved_downloads.append(str(target))
         except BaseException as exc:
             if isinstance(exc, asyncio.CancelledError):
@@ -658,10 +1105,10 @@ def process_mod(
             download_errors.append(f"{name}: {exc}")
 
     page.on("download", on_download)
-    print("[i] Trying direct slow/free download click...")
+    log("[i] Trying direct slow/free download click...")
     slow_selector = click_first_visible(page, SLOW_SELECTORS, timeout_sec=click_timeout_sec)
     if not slow_selector:
-        print("[i] Direct slow click not found. Trying manual-then-slow path...")
+        log("[i] Direct slow click not found. Trying manual-then-slow path...")
         manual_selector = click_first_visible(page, MANUAL_SELECTORS, timeout_sec=click_timeout_sec)
         if not manual_selector:
             try:
@@ -678,29 +1125,33 @@ def process_mod(
                 pass
             return ItemResult(0, mod_url, "partial", "download_confirmation_button_not_found")
 
-    print(f"[i] Clicked selector: {slow_selector}. Waiting for download signal...")
+    log(f"[i] Clicked selector: {slow_selector}. Waiting for download signal...")
 
     if verify_downloads:
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
         deadline = time.time() + max(3, download_timeout_sec)
         manual_retry_used = False
+        scanned_generation: Optional[int] = None
+        scanned = False
         while time.time() < deadline:
             if saved_downloads:
                 try:
                     page.remove_listener("download", on_download)
                 except Exception:
                     pass
-                return ItemResult(0, mod_url, "ok", f"download_saved:{saved_downloads[-1]}")
+                return ItemResult(0, mod_url, "ok", f"download_saved:{saved_downloads[-1]}", saved_downloads[-1])
 
             if seen_downloads:
                 last_name = seen_downloads[-1]
                 if is_good_archive_name(last_name):
                     # Event fired but save failed so far; keep waiting briefly for save/file detection.
                     if download_errors:
-                        print(f"[i] Download event save issue: {download_errors[-1]}")
+                        log(f"[i] Download event save issue: {download_errors[-1]}")
                 else:
                     if not manual_retry_used:
                         manual_retry_used = True
-                        print(f"[i] Suspicious filename '{last_name}'. Trying manual retry link...")
+                        log(f"[i] Suspicious filename '{last_name}'. Trying manual retry link...")
                         click_first_visible(
                             page,
                             [
@@ -722,7 +1173,7 @@ def process_mod(
                 if started_text.count() > 0 and started_text.is_visible():
                     if not manual_retry_used:
                         manual_retry_used = True
-                        print("[i] Download start page detected. Triggering manual link to get file event...")
+                        log("[i] Download start page detected. Triggering manual link to get file event...")
                         click_first_visible(
                             page,
                             [
@@ -736,7 +1187,12 @@ def process_mod(
             except Exception:
                 pass
 
-            downloaded = wait_for_new_completed_download(downloads_dir, baseline, timeout_sec=1)
+            generation = watcher.generation() if watcher is not None else None
+            downloaded = None
+            if scan_folder and (generation is None or not scanned or generation != scanned_generation):
+                scanned_generation = generation
+                scanned = True
+                downloaded = find_new_completed_download(downloads_dir, baseline, claimed_paths)
             if downloaded:
                 try:
                     page.remove_listener("download", on_download)
@@ -744,7 +1200,11 @@ def process_mod(
                     pass
                 return ItemResult(0, mod_url, "ok", f"download_file_detected:{downloaded.name}")
 
-            page.wait_for_timeout(500)
+            # Wake as soon as the browser reports a download instead of sleeping a fixed interval.
+            try:
+                page.wait_for_event("download", timeout=1000)
+            except PlaywrightTimeoutError:
+                pass
 
         try:
             page.remove_listener("download", on_download)
@@ -780,13 +1240,16 @@ def build_summary_lines(run_id: str, run_data: dict[str, Any], json_log: Path) -
     ]
 
 
-def write_run_logs(run_id: str, run_data: dict[str, Any], json_log: Path, txt_log: Path) -> None:
+def write_run_logs(run_id: str, run_data: dict[str, Any], json_log: Path, txt_log: Path) -> list[str]:
     summary_lines = build_summary_lines(run_id, run_data, json_log)
-    json_log.write_text(json.dumps(run_data, indent=2), encoding="utf-8")
-    txt_log.write_text("\n".join(summary_lines) + "\n", encoding="utf-8")
+    with json_log.open("w", encoding="utf-8", buffering=LOG_BUFFER_SIZE) as fh:
+        json.dump(run_data, fh, indent=2)
+    with txt_log.open("w", encoding="utf-8", buffering=LOG_BUFFER_SIZE) as fh:
+        fh.writelines(f"{line}\n" for line in summary_lines)
+    return summary_lines
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Browser-first Nexus collection helper using existing logged-in browser via CDP."
     )
@@ -818,25 +1281,130 @@ def parse_args() -> argparse.Namespace:
         default=45,
         help="Seconds to wait for a new completed file when --verify-downloads is enabled.",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--download-workers",
+        type=int,
+        default=4,
+        help="Parallel direct HTTP downloads when --verify-downloads is enabled.",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help=(
+            "Browser pages working through mods that need the click flow (each uses its own CDP connection). "
+            "Above 1, --verify-downloads only counts downloads the page itself reports, not new files in the folder."
+        ),
+    )
+    parser.add_argument(
+        "--use-daemon",
+        action="store_true",
+        help="Hand the run to a running nexus_browser_daemon.py, which keeps its browser connection between runs.",
+    )
+    args = parser.parse_args(argv)
+    args.collection_url = args.collection_url.strip()
+    return args
+
+
+@contextmanager
+def open_browser_context(cdp_url: str, shared_context: Any = None) -> Iterator[Any]:
+    if shared_context is not None:
+        yield shared_context
+        return
+    # Deferred until the URL is validated: importing Playwright is the bulk of startup time.
+    from playwright.sync_api import sync_playwright
+
+    with sync_playwright() as p:
+        browser = p.chromium.connect_over_cdp(cdp_url)
+        yield browser.contexts[0] if browser.contexts else browser.new_context()
+        try:
+            browser.close()
+        except Exception:
+            pass
+
+
+@contextmanager
+def open_run_page(context: Any, close: bool) -> Iterator[Any]:
+    page = context.new_page()
+    try:
+        yield page
+    finally:
+        if close:
+            try:
+                page.close()
+            except Exception:
+                pass
+
+
+def browser_worker(
+    cdp_url: str,
+    jobs: queue.Queue[Optional[tuple[int, str, bool]]],
+    results: queue.Queue[ItemResult],
+    process_kwargs: dict[str, Any],
+    delay_sec: float,
+    attach_errors: list[str],
+) -> None:
+    """Run click-flow jobs on a private page; sync Playwright objects stay on the thread that made them."""
+    from playwright.sync_api import sync_playwright
+
+    try:
+        with sync_playwright() as p:
+            browser = p.chromium.connect_over_cdp(cdp_url)
+            context = browser.contexts[0] if browser.contexts else browser.new_context()
+            page = context.new_page()
+            delay = AdaptiveDelay(delay_sec)
+            try:
+                while (job := jobs.get()) is not None:
+                    idx, mod_url, skip_direct = job
+                    started = time.monotonic()
+                    try:
+                        # Other workers share the folder, so only this page's own download events count.
+                        item = process_mod(
+                            page,
+                            mod_url,
+                            **process_kwargs,
+                            verbose=False,
+                            skip_direct=skip_direct,
+                            scan_folder=False,
+                        )
+                    except Exception as e:
+                        item = ItemResult(idx, mod_url, "fail", f"worker_error: {e}")
+                    item.index = idx
+                    results.put(item)
+                    page.wait_for_timeout(int(delay.observe(time.monotonic() - started, item.reason) * 1000))
+            finally:
+                try:
+                    page.close()
+                except Exception:
+                    pass
+    except Exception as e:
+        # Could not attach: leave the queue to the other workers.
+        attach_errors.append(str(e))
 
 
-def main() -> int:
-    args = parse_args()
-    if not COLLECTION_URL_RE.match(args.collection_url.strip()):
+def main(argv: Optional[list[str]] = None, shared_context: Any = None) -> int:
+    args = parse_args(argv)
+    collection_url = parse_and_clean_collection_url(args.collection_url)
+    if collection_url is None:
         print("[!] Invalid collection URL format.")
         return 2
+    if args.use_daemon and shared_context is None:
+        from nexus_browser_daemon import run_via_daemon
+
+        forwarded = [arg for arg in (sys.argv[1:] if argv is None else argv) if arg != "--use-daemon"]
+        return run_via_daemon(forwarded, args.log_dir)
 
     run_id = now_stamp()
     log_dir = args.log_dir
     log_dir.mkdir(parents=True, exist_ok=True)
     json_log = log_dir / f"browser-first-{run_id}.json"
     txt_log = log_dir / f"browser-first-{run_id}.txt"
+    results_jsonl = log_dir / f"browser-first-{run_id}.results.jsonl"
 
     run_data: dict[str, Any] = {
         "run_id": run_id,
         "timestamp": datetime.now().isoformat(),
-        "collection_url": clean_collection_url(args.collection_url),
+        "collection_url": collection_url,
         "cdp_url": args.cdp_url,
         "dry_run": bool(args.dry_run),
         "max_mods": int(args.max_mods),
@@ -846,25 +1414,34 @@ def main() -> int:
         "extraction": {},
         "verify_downloads": bool(args.verify_downloads),
         "downloads_dir": str(args.downloads_dir),
+        "results_jsonl": str(results_jsonl),
     }
 
+    results_fh = results_jsonl.open("a", encoding="utf-8", buffering=LOG_BUFFER_SIZE)
     interrupted = False
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.connect_over_cdp(args.cdp_url)
-            context = browser.contexts[0] if browser.contexts else browser.new_context()
-            page = context.new_page()
+        # Under the daemon only this run's tab is closed; the connection stays for the next run.
+        with (
+            open_browser_context(args.cdp_url, shared_context) as context,
+            open_run_page(context, close=shared_context is not None) as page,
+            closing(HttpSession()) as session,
+        ):
             try:
                 cookies = context.cookies(["https://www.nexusmods.com"])
-                cookie_header = "; ".join(f"{c['name']}={c['value']}" for c in cookies)
+                cookie_header = cookie_header_from(cookies)
             except Exception:
                 cookie_header = ""
 
             print(f"[+] Loading collection mods page: {run_data['collection_url']}")
-            extraction = collect_links_via_network(page, run_data["collection_url"])
+            extraction, game_id = collect_collection_links(
+                page,
+                run_data["collection_url"],
+                cookie_header,
+                log_dir / GRAPHQL_CACHE_FILE,
+                session,
+            )
             links = extraction.links
-            run_data["extraction"]["network_graphql"] = extraction.details
-            game_id = extract_game_id(page.content())
+            run_data["extraction"][extraction.strategy] = extraction.details
             run_data["game_id"] = game_id
 
             if not links:
@@ -891,30 +1468,133 @@ def main() -> int:
                 artifacts = write_zero_queue_artifacts(page, log_dir, run_id)
                 run_data["extraction"]["zero_queue_artifacts"] = artifacts
 
-            for idx, mod_url in enumerate(links, start=1):
-                print(f"\n[{idx}/{len(links)}] {mod_url}")
-                item = process_mod(
-                    page,
-                    mod_url,
-                    args.click_timeout_sec,
-                    args.dry_run,
-                    args.verify_downloads,
-                    args.downloads_dir,
-                    args.download_timeout_sec,
-                    cookie_header,
-                    game_id,
-                )
-                item.index = idx
-                run_data["results"].append(asdict(item))
+            pool = concurrent.futures.ThreadPoolExecutor(max_workers=max(1, args.download_workers))
+            direct_paths: set[Path] = set()
+            cancel = threading.Event()
+            delay = AdaptiveDelay(args.delay_sec)
+            jobs: queue.Queue[Optional[tuple[int, str, bool]]] = queue.Queue()
+            worker_results: queue.Queue[ItemResult] = queue.Queue()
+            workers: list[threading.Thread] = []
+            attach_errors: list[str] = []
+            pending = 0
+            watcher = DownloadWatcher(args.downloads_dir)
+            if args.verify_downloads and not args.dry_run and watcher.start():
+                print("[i] Watching downloads folder for changes.")
+
+            def record(item: ItemResult) -> None:
+                row = item_to_dict(item)
+                run_data["results"].append(row)
                 print(f"[{item.status}] {item.reason}")
-                write_run_logs(run_id, run_data, json_log, txt_log)
-                if idx < len(links):
-                    page.wait_for_timeout(int(args.delay_sec * 1000))
+                results_fh.write(json.dumps(row, separators=(",", ":")) + "\n")
+                results_fh.flush()
+
+            def record_worker_result(item: ItemResult) -> None:
+                print(f"\n[{item.index}/{len(links)}] {item.mod_url}")
+                record(item)
 
             try:
-                browser.close()
-            except Exception:
-                pass
+                if args.concurrency > 1:
+                    process_kwargs = {
+                        "click_timeout_sec": args.click_timeout_sec,
+                        "dry_run": args.dry_run,
+                        "verify_downloads": args.verify_downloads,
+                        "downloads_dir": args.downloads_dir,
+                        "download_timeout_sec": args.download_timeout_sec,
+                        "cookie_header": cookie_header,
+                        "game_id": game_id,
+                        "session": session,
+                        "watcher": watcher,
+                        "claimed_paths": direct_paths,
+                    }
+                    for _ in range(args.concurrency):
+                        worker = threading.Thread(
+                            target=browser_worker,
+                            args=(args.cdp_url, jobs, worker_results, process_kwargs, args.delay_sec, attach_errors),
+                            daemon=True,
+                        )
+                        worker.start()
+                        workers.append(worker)
+
+                direct_futures: list[Optional[concurrent.futures.Future[Optional[ItemResult]]]] = [
+                    pool.submit(
+                        try_direct_download,
+                        mod_url,
+                        args.downloads_dir,
+                        cookie_header,
+                        game_id,
+                        session,
+                        verbose=False,
+                        claimed=direct_paths,
+                        cancel=cancel,
+                    )
+                    if args.verify_downloads and not args.dry_run
+                    else None
+                    for mod_url in links
+                ]
+                for idx, mod_url in enumerate(links, start=1):
+                    direct_future = direct_futures[idx - 1]
+                    item = direct_future.result() if direct_future is not None else None
+                    used_browser = item is None
+                    if item is None and workers:
+                        jobs.put((idx, mod_url, direct_future is not None))
+                        pending += 1
+                    else:
+                        print(f"\n[{idx}/{len(links)}] {mod_url}")
+                        started = time.monotonic()
+                        if item is None:
+                            item = process_mod(
+                                page,
+                                mod_url,
+                                args.click_timeout_sec,
+                                args.dry_run,
+                                args.verify_downloads,
+                                args.downloads_dir,
+                                args.download_timeout_sec,
+                                cookie_header,
+                                game_id,
+                                session,
+                                skip_direct=direct_future is not None,
+                                watcher=watcher,
+                                claimed_paths=direct_paths,
+                            )
+                        item.index = idx
+                        record(item)
+                        if used_browser and idx < len(links):
+                            # Playwright's own wait keeps download events flowing, unlike time.sleep.
+                            page.wait_for_timeout(int(delay.observe(time.monotonic() - started, item.reason) * 1000))
+                    while pending and not worker_results.empty():
+                        record_worker_result(worker_results.get())
+                        pending -= 1
+                while pending:
+                    # Short timeouts keep Ctrl+C responsive on Windows, where a blocking get() ignores it.
+                    try:
+                        record_worker_result(worker_results.get(timeout=0.5))
+                    except queue.Empty:
+                        if not any(worker.is_alive() for worker in workers):
+                            last_error = attach_errors[-1] if attach_errors else "no browser worker running"
+                            reason = f"worker_error: {last_error}"
+                            while True:
+                                try:
+                                    job = jobs.get_nowait()
+                                except queue.Empty:
+                                    break
+                                if job is not None:
+                                    worker_results.put(ItemResult(job[0], job[1], "fail", reason))
+                            if worker_results.empty():
+                                break
+                        continue
+                    pending -= 1
+            except BaseException:
+                cancel.set()
+                pool.shutdown(wait=False, cancel_futures=True)
+                raise
+            else:
+                pool.shutdown(wait=True)
+            finally:
+                for _ in workers:
+                    jobs.put(None)
+                watcher.stop()
+                run_data["results"].sort(key=lambda r: r["index"])
     except KeyboardInterrupt:
         interrupted = True
         run_data["interrupted"] = True
@@ -923,9 +1603,10 @@ def main() -> int:
     except Exception as e:
         run_data["fatal_error"] = str(e)
         print(f"[!] Fatal error: {e}")
+    finally:
+        results_fh.close()
 
-    write_run_logs(run_id, run_data, json_log, txt_log)
-    summary_lines = build_summary_lines(run_id, run_data, json_log)
+    summary_lines = write_run_logs(run_id, run_data, json_log, txt_log)
 
     print("\n" + "=" * 64)
     for line in summary_lines:
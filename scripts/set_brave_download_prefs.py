@@ -29,6 +29,18 @@ def main() -> int:
         return 1
 
     downloads_dir = str(Path(user_profile) / "Downloads")
+    download = prefs.get("download")
+    savefile = prefs.get("savefile")
+    if (
+        isinstance(download, dict)
+        and isinstance(savefile, dict)
+        and download.get("prompt_for_download") is False
+        and savefile.get("type") == 0
+        and savefile.get("default_directory") == downloads_dir
+    ):
+        print(f"[i] Brave preferences already set, nothing to write: {pref_path}")
+        return 0
+
     prefs.setdefault("download", {})
     prefs["download"]["prompt_for_download"] = False
     prefs.setdefault("savefile", {})
@@ -37,8 +49,12 @@ def main() -> int:
 
     temp_path = pref_path.with_suffix(".tmp")
     try:
-        temp_path.write_text(json.dumps(prefs, separators=(",", ":")), encoding="utf-8")
-        temp_path.replace(pref_path)
+        with temp_path.open("w", encoding="utf-8") as fh:
+            json.dump(prefs, fh, separators=(",", ":"))
+            fh.flush()
+            # Make the new contents durable before the rename replaces the only good copy.
+            os.fsync(fh.fileno())
+        os.replace(temp_path, pref_path)
     except Exception as exc:
         print(f"[!] Could not write updated preferences: {exc}")
         return 1
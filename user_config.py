@@ -4,7 +4,7 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Any, Optional
 
@@ -17,6 +17,10 @@ class AppConfig:
     cdp_url: str = "http://127.0.0.1:9222"
 
 
+# Parsed configs keyed by path, valid while the file's st_mtime_ns is unchanged.
+_CONFIG_CACHE: dict[Path, tuple[int, AppConfig]] = {}
+
+
 def _path_or_none(value: Any) -> Optional[Path]:
     if not isinstance(value, str):
         return None
@@ -27,18 +31,26 @@ def _path_or_none(value: Any) -> Optional[Path]:
 
 
 def load_config(path: Path) -> AppConfig:
-    if not path.exists():
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
         return AppConfig()
+    cached = _CONFIG_CACHE.get(path)
+    if cached is not None and cached[0] == mtime_ns:
+        # Callers mutate the config they get back, so never hand out the cached instance.
+        return replace(cached[1])
     try:
         raw = json.loads(path.read_text(encoding="utf-8"))
     except Exception:
         return AppConfig()
-    return AppConfig(
+    config = AppConfig(
         collection_url=raw.get("collection_url") if isinstance(raw.get("collection_url"), str) else None,
         downloads_dir=_path_or_none(raw.get("downloads_dir")),
         install_dir=_path_or_none(raw.get("install_dir")),
         cdp_url=raw.get("cdp_url") if isinstance(raw.get("cdp_url"), str) else "http://127.0.0.1:9222",
     )
+    _CONFIG_CACHE[path] = (mtime_ns, config)
+    return replace(config)
 
 
 def save_config(path: Path, config: AppConfig) -> None:
@@ -48,4 +60,6 @@ def save_config(path: Path, config: AppConfig) -> None:
         "install_dir": str(config.install_dir) if config.install_dir else "",
         "cdp_url": config.cdp_url,
     }
-    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    with path.open("w", encoding="utf-8") as fh:
+        json.dump(payload, fh, indent=2)
+    _CONFIG_CACHE.pop(path, None)
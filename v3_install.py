@@ -4,13 +4,45 @@
 from __future__ import annotations
 
 import json
+import os
 import shutil
+import string
 import subprocess
+import zipfile
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
+
+try:
+    import py7zr
+except ImportError:  # optional: extract .7z in-process instead of spawning 7-Zip
+    py7zr = None
+
+MERGE_COPY_WORKERS = 8
+# Extraction is disk-bound, so more processes than this only contend; it also stays under
+# ProcessPoolExecutor's Windows limit of 61 workers.
+MAX_EXTRACT_WORKERS = 8
+LOG_BUFFER_SIZE = 64 * 1024
+ARCHIVE_MAGIC = (
+    (b"PK\x03\x04", "zip"),
+    (b"PK\x05\x06", "zip"),
+    (b"Rar!\x1a\x07", "rar"),
+    (b"7z\xbc\xaf\x27\x1c", "7z"),
+    (b"\x1f\x8b", "gzip"),
+)
+ARCHIVE_MAGIC_LEN = max(len(magic) for magic, _ in ARCHIVE_MAGIC)
+ARCHIVE_SUFFIX_FORMATS = {".zip": "zip", ".7z": "7z", ".rar": "rar"}
+
+
+_SAFE_STEM_CHARS = frozenset(string.ascii_letters + string.digits + "-_.")
+_SAFE_STEM_TABLE = str.maketrans({chr(c): "_" for c in range(128) if chr(c) not in _SAFE_STEM_CHARS})
 
 
 def _safe_stem(name: str) -> str:
+    if name.isascii():
+        return name.translate(_SAFE_STEM_TABLE).strip("._") or "archive"
+    # Non-ASCII letters and digits are kept, which a fixed table cannot express.
     keep = []
     for ch in name:
         if ch.isalnum() or ch in ("-", "_", "."):
@@ -20,18 +52,57 @@ def _safe_stem(name: str) -> str:
     return "".join(keep).strip("._") or "archive"
 
 
-def _extract_archive(archive_path: Path, target_dir: Path) -> tuple[bool, str]:
-    target_dir.mkdir(parents=True, exist_ok=True)
+def _archive_format(archive_path: Path) -> Optional[str]:
+    """Archive format from the file's leading bytes, falling back to its extension."""
     try:
-        shutil.unpack_archive(str(archive_path), str(target_dir))
-        return True, "unpack_archive"
-    except Exception:
-        pass
+        with archive_path.open("rb") as fh:
+            head = fh.read(ARCHIVE_MAGIC_LEN)
+    except OSError:
+        head = b""
+    for magic, fmt in ARCHIVE_MAGIC:
+        if head.startswith(magic):
+            return fmt
+    return ARCHIVE_SUFFIX_FORMATS.get(archive_path.suffix.lower())
+
 
-    seven_zip = shutil.which("7z") or shutil.which("7za")
+@lru_cache(maxsize=1)
+def _seven_zip_path() -> Optional[str]:
+    # shutil.which walks PATH (and PATHEXT on Windows); the answer does not change during a run.
+    return shutil.which("7z") or shutil.which("7za")
+
+
+def _extract_archive(archive_path: Path, target_dir: Path) -> tuple[bool, str]:
+    target_dir.mkdir(parents=True, exist_ok=True)
+    fmt = _archive_format(archive_path)
+    if fmt == "zip":
+        try:
+            with zipfile.ZipFile(archive_path) as zf:
+                zf.extractall(target_dir)
+            return True, "zipfile"
+        except Exception:
+            # Deflate64 (Explorer's large zips), encrypted entries and damaged archives all
+            # raise here; 7-Zip below handles what zipfile cannot.
+            pass
+    elif fmt == "7z" and py7zr is not None:
+        try:
+            with py7zr.SevenZipFile(archive_path, mode="r") as sz:
+                sz.extractall(path=target_dir)
+            return True, "py7zr"
+        except Exception:
+            pass
+    elif fmt not in ("7z", "rar"):
+        # shutil has no 7z or rar support, so those go straight to 7-Zip.
+        try:
+            shutil.unpack_archive(str(archive_path), str(target_dir))
+            return True, "unpack_archive"
+        except Exception:
+            pass
+
+    seven_zip = _seven_zip_path()
     if seven_zip:
         cmd = [seven_zip, "x", "-y", f"-o{target_dir}", str(archive_path)]
-        result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+        # 7-Zip lists every extracted file on stdout; only stderr is needed for the failure reason.
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=False)
         if result.returncode == 0:
             return True, "7z"
         return False, f"7z_failed:{result.stderr.strip()[:200]}"
@@ -39,17 +110,46 @@ def _extract_archive(archive_path: Path, target_dir: Path) -> tuple[bool, str]:
     return False, "unsupported_archive_or_missing_7z"
 
 
-def _merge_tree(source_dir: Path, target_dir: Path) -> int:
-    copied = 0
-    for src in source_dir.rglob("*"):
-        if not src.is_file():
-            continue
-        rel = src.relative_to(source_dir)
-        dst = target_dir / rel
-        dst.parent.mkdir(parents=True, exist_ok=True)
+def _move_file(src: str, dst: str) -> None:
+    try:
+        os.replace(src, dst)
+    except OSError:
+        # e.g. the target is locked or is a directory; copying still overwrites what it can.
         shutil.copy2(src, dst)
-        copied += 1
-    return copied
+
+
+def _merge_tree(source_dir: Path, target_dir: Path) -> int:
+    sources: list[str] = []
+    targets: list[str] = []
+    stack = [(str(source_dir), str(target_dir))]
+    while stack:
+        src_dir, dst_dir = stack.pop()
+        os.makedirs(dst_dir, exist_ok=True)
+        with os.scandir(src_dir) as it:
+            for entry in it:
+                dst = os.path.join(dst_dir, entry.name)
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, dst))
+                elif entry.is_file():
+                    sources.append(entry.path)
+                    targets.append(dst)
+
+    if os.stat(source_dir).st_dev == os.stat(target_dir).st_dev:
+        # Staging and install dir share a volume: renaming moves no file data.
+        for src, dst in zip(sources, targets):
+            _move_file(src, dst)
+        return len(sources)
+
+    # Many small files are latency-bound, which a few threads hide. Paths that differ only in case
+    # (Foo.txt and foo.txt) are one file on Windows, so those archives are copied serially in walk order.
+    if len(sources) > 1 and len({os.path.normcase(t).casefold() for t in targets}) == len(targets):
+        with ThreadPoolExecutor(max_workers=min(MERGE_COPY_WORKERS, len(sources))) as pool:
+            for _ in pool.map(shutil.copy2, sources, targets):
+                pass
+    else:
+        for src, dst in zip(sources, targets):
+            shutil.copy2(src, dst)
+    return len(sources)
 
 
 def install_downloaded_archives(
@@ -57,6 +157,7 @@ def install_downloaded_archives(
     install_dir: Path,
     log_dir: Path,
     run_id: str,
+    workers: int = 1,
 ) -> dict[str, Any]:
     install_dir.mkdir(parents=True, exist_ok=True)
     stage_root = log_dir / f"nexus-collection-batch-install-{run_id}"
@@ -66,39 +167,60 @@ def install_downloaded_archives(
     installed = 0
     failed = 0
 
-    seen: set[str] = set()
-    unique_downloads: list[Path] = []
-    for p in downloaded_paths:
-        key = str(p)
-        if key in seen:
-            continue
-        seen.add(key)
-        unique_downloads.append(p)
+    # Keyed by resolved path so relative, absolute and symlinked spellings of one file install once.
+    unique_downloads = list({os.path.realpath(p): Path(p) for p in downloaded_paths}.values())
 
+    pending: list[tuple[dict[str, Any], Path, Path]] = []
+    used_stems: set[str] = set()
     for archive in unique_downloads:
         item: dict[str, Any] = {"archive": str(archive), "status": "pending", "reason": ""}
+        results.append(item)
         if not archive.exists():
             item["status"] = "failed"
             item["reason"] = "archive_not_found"
             failed += 1
-            results.append(item)
             continue
-
-        extract_dir = stage_root / _safe_stem(archive.name)
-        ok, method = _extract_archive(archive, extract_dir)
-        if not ok:
-            item["status"] = "failed"
-            item["reason"] = method
-            failed += 1
-            results.append(item)
-            continue
-
-        copied_files = _merge_tree(extract_dir, install_dir)
-        item["status"] = "installed"
-        item["reason"] = f"method:{method}"
-        item["copied_files"] = copied_files
-        installed += 1
-        results.append(item)
+        # Archives are extracted concurrently, so each one needs its own staging folder.
+        stem = _safe_stem(archive.name)
+        unique_stem = stem
+        suffix = 2
+        while unique_stem.lower() in used_stems:
+            unique_stem = f"{stem}-{suffix}"
+            suffix += 1
+        used_stems.add(unique_stem.lower())
+        pending.append((item, archive, stage_root / unique_stem))
+
+    archives = [archive for _, archive, _ in pending]
+    extract_dirs = [extract_dir for _, _, extract_dir in pending]
+    pool_size = min(max(1, workers), len(pending), MAX_EXTRACT_WORKERS)
+    pool: Optional[Executor] = None
+    if pool_size > 1:
+        pool = ProcessPoolExecutor(max_workers=pool_size)
+    elif len(pending) > 1:
+        # Even single-worker runs pipeline: the next archive extracts (7-Zip process or zlib,
+        # both outside the GIL) while this thread merges the previous one.
+        pool = ThreadPoolExecutor(max_workers=1)
+    try:
+        if pool is not None:
+            outcomes = pool.map(_extract_archive, archives, extract_dirs)
+        else:
+            outcomes = map(_extract_archive, archives, extract_dirs)
+        # Merge in download order so later archives still overwrite earlier ones.
+        for (item, archive, extract_dir), (ok, method) in zip(pending, outcomes):
+            if not ok:
+                item["status"] = "failed"
+                item["reason"] = method
+                failed += 1
+                continue
+
+            copied_files = _merge_tree(extract_dir, install_dir)
+            item["status"] = "installed"
+            item["reason"] = f"method:{method}"
+            item["copied_files"] = copied_files
+            installed += 1
+    finally:
+        if pool is not None:
+            pool.shutdown()
 
     payload = {
         "installed": installed,
@@ -107,7 +229,9 @@ def install_downloaded_archives(
         "stage_dir": str(stage_root),
         "install_dir": str(install_dir),
     }
-    (log_dir / f"nexus-collection-batch-install-{run_id}.json").write_text(
-        json.dumps(payload, indent=2), encoding="utf-8"
-    )
+    # Streamed to the file rather than built as one string; the results list grows with the archive count.
+    with (log_dir / f"nexus-collection-batch-install-{run_id}.json").open(
+        "w", encoding="utf-8", buffering=LOG_BUFFER_SIZE
+    ) as fh:
+        json.dump(payload, fh, indent=2)
     return payload